@@ -8,10 +8,13 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from optimizer import run_optimization, predict_speed, size_diameter
-import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+# Only lightweight modules load at startup; the optimizer (and scipy), pandas
+# and matplotlib are imported on the code paths that use them
+from result_cache import ResultCache
+from instrumentation import StageTimer
+from jobs import JobQueue
+from figures import INITIAL_ETA, render_summary_png, summary_key, summary_plotly
+from reports import optimizer_row, render_txt
 
 # Page configuration
 st.set_page_config(
@@ -21,6 +24,22 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Persistent result cache shared by all sessions and server processes
+@st.cache_resource
+def get_result_cache():
+    """Open the on-disk optimization result cache once per server process"""
+    return ResultCache()
+
+# Optimization jobs run in a process pool shared by every session on this server
+# Longest a session waits for its job (queueing included) before giving up
+JOB_TIMEOUT_S = 300
+
+@st.cache_resource
+def get_job_queue():
+    """Start the optimization job queue once per server process"""
+    from optimizer import run_optimization
+    return JobQueue(run_optimization, cache=get_result_cache())
+
 # Custom CSS for better appearance (inspired by successful Streamlit apps)
 st.markdown("""
 <style>
@@ -154,6 +173,10 @@ rpm = st.sidebar.number_input(
 with st.sidebar.expander("🔬 Advanced Parameters"):
     beam_m = st.number_input("Beam (m)", min_value=1.0, max_value=10.0, value=2.96, step=0.1)
     loa_m = st.number_input("Length Overall (m)", min_value=5.0, max_value=50.0, value=13.5, step=0.5)
+    chart_renderer = st.radio("Charts", ["Static (PNG)", "Interactive (Plotly)"],
+                              help="Interactive charts are drawn in your browser instead of on the server")
+    show_timing = st.checkbox("Show timing breakdown", value=False,
+                              help="Record where the time goes in each optimization run")
 
 # Main content - Two columns
 col1, col2 = st.columns([1, 1])
@@ -178,9 +201,27 @@ if optimize_button:
             'rpm': rpm
         }
 
-        # Run optimization
+        import pandas as pd
+
+        timer = StageTimer(enabled=show_timing)
+
+        # Run optimization (submitted to the shared job queue, polled until done)
         try:
-            result = run_optimization(params)
+            with timer.stage('Optimization'):
+                job_queue = get_job_queue()
+                job_id = job_queue.submit(params)
+                job_status = st.empty()
+                while not job_queue.wait(job_id, timeout=0.25):
+                    job = job_queue.status(job_id)
+                    if job['elapsed_s'] > JOB_TIMEOUT_S:
+                        job_status.empty()
+                        raise TimeoutError(f"no result after {JOB_TIMEOUT_S} s (job {job['state']})")
+                    if job['state'] == 'queued':
+                        job_status.caption(f"⏳ Queued behind {job['queue_position']} other job(s)...")
+                    else:
+                        job_status.caption(f"⚙️ Running... {job['elapsed_s']:.1f} s")
+                job_status.empty()
+                result = job_queue.result(job_id)
 
             # Success message
             st.markdown('<div class="success-box">✅ <strong>Optimization Complete!</strong> Your propeller has been designed.</div>', unsafe_allow_html=True)
@@ -210,7 +251,7 @@ if optimize_button:
                 st.metric(
                     label="Efficiency (η)",
                     value=f"{result['eta']:.3f}",
-                    delta=f"+28% vs baseline",
+                    delta=f"{(result['eta'] / INITIAL_ETA - 1) * 100:+.0f}% vs initial estimate",
                     delta_color="normal",
                     help="Propeller efficiency"
                 )
@@ -248,87 +289,45 @@ if optimize_button:
             # Visualization
             st.subheader("📈 Performance Visualization")
 
-            # Create plots
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
-
-            # Plot 1: Efficiency comparison
-            categories = ['Initial\nEstimate', 'After\nOptimization']
-            values = [0.55, result['eta']]
-            colors = ['#ff7f0e', '#2ca02c']
-
-            ax1.bar(categories, values, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
-            ax1.set_ylabel('Efficiency (η)', fontweight='bold')
-            ax1.set_title('Efficiency Improvement', fontweight='bold', fontsize=12)
-            ax1.set_ylim([0, 1.0])
-            ax1.grid(True, alpha=0.3, axis='y')
-
-            # Add value labels
-            for i, v in enumerate(values):
-                ax1.text(i, v + 0.02, f'{v:.3f}\n({v*100:.1f}%)',
-                        ha='center', fontweight='bold')
-
-            # Plot 2: Parameter radar
-            params_display = ['D\n(m)', 'P/D', 'KT\n(×10)', 'KQ\n(×100)', 'η']
-            params_values = [
-                result['D'],
-                result['P_D'],
-                result['KT'] * 10,
-                result['KQ'] * 100,
-                result['eta']
-            ]
-
-            x_pos = np.arange(len(params_display))
-            ax2.bar(x_pos, params_values, color='#1f77b4', alpha=0.7, edgecolor='black', linewidth=2)
-            ax2.set_xticks(x_pos)
-            ax2.set_xticklabels(params_display, fontsize=10)
-            ax2.set_ylabel('Value', fontweight='bold')
-            ax2.set_title('Optimized Parameters', fontweight='bold', fontsize=12)
-            ax2.grid(True, alpha=0.3, axis='y')
-
-            # Add value labels
-            for i, v in enumerate(params_values):
-                ax2.text(i, v + 0.02, f'{v:.2f}', ha='center', fontweight='bold', fontsize=9)
-
-            plt.tight_layout()
-            st.pyplot(fig)
+            with timer.stage('Plot rendering'):
+                if chart_renderer == "Interactive (Plotly)":
+                    st.plotly_chart(summary_plotly(result), use_container_width=True)
+                else:
+                    st.image(render_summary_png(summary_key(result)))
+
+            # Hull resistance (Savitsky) against the design thrust
+            st.subheader("🌊 Resistance & Thrust Check")
+
+            with timer.stage('Resistance curve'):
+                import numpy as np
+
+                from savitsky import propeller_thrust_kn, resistance
+
+                speeds = np.linspace(max(5.0, V_knots * 0.5), V_knots * 1.2, 60)
+                curve = resistance(speeds, displacement_t, beam_m, loa_m=loa_m)
+                design_point = resistance(V_knots, displacement_t, beam_m, loa_m=loa_m)
+                thrust_kn = float(propeller_thrust_kn(result['KT'], rpm, result['D']))
+
+            hull_resistance_kn = float(design_point['resistance_kn'])
+            margin = thrust_kn / hull_resistance_kn - 1
+            check_col1, check_col2, check_col3 = st.columns(3)
+            check_col1.metric("Hull Resistance", f"{hull_resistance_kn:.1f} kN",
+                              f"trim {float(design_point['trim_deg']):.1f}°", delta_color="off")
+            check_col2.metric("Propeller Thrust", f"{thrust_kn:.1f} kN")
+            check_col3.metric("Thrust Margin", f"{margin * 100:+.0f}%")
+            if not design_point['valid']:
+                st.caption("⚠️ Design point is outside the range of Savitsky's data (trim 2-15°, λ ≤ 4); treat as indicative")
+
+            st.line_chart(pd.DataFrame({
+                'Resistance (kN)': curve['resistance_kn'],
+                'Effective Power (kW / 10)': curve['effective_power_kw'] / 10,
+            }, index=pd.Index(speeds.round(1), name='Speed (knots)')))
 
             # Download results
             st.subheader("💾 Export Results")
 
-            # Create downloadable report
-            report = f"""
-MARINE PROPELLER DESIGN REPORT
-Generated by Propeller Optimizer
-================================
-
-VESSEL SPECIFICATIONS
----------------------
-Speed:              {V_knots} knots
-Displacement:       {displacement_t} tons
-Draft:              {draft_m} m
-Engine Power:       {power_kw} kW
-Propeller RPM:      {rpm}
-
-OPTIMIZED PROPELLER DESIGN
---------------------------
-Diameter (D):       {result['D']:.3f} m ({result['D']*39.37:.2f} inches)
-Pitch Ratio (P/D):  {result['P_D']:.3f}
-Thrust Coeff (KT):  {result['KT']:.4f}
-Torque Coeff (KQ):  {result['KQ']:.4f}
-Efficiency (η):     {result['eta']:.4f} ({result['eta']*100:.1f}%)
-
-PERFORMANCE
------------
-Efficiency Gain:    +28% vs initial estimate
-Status:             ✅ OPTIMIZED
-
-DISCLAIMER
-----------
-This is a preliminary design tool. Always consult with
-professional marine engineers before manufacturing.
-
-Generated: {pd.Timestamp.now()}
-"""
+            # Create downloadable report (same per-vessel layout as fleet reports)
+            report = render_txt(params, optimizer_row(result), generated=pd.Timestamp.now())
 
             col_a, col_b = st.columns(2)
             with col_a:
@@ -348,18 +347,58 @@ Generated: {pd.Timestamp.now()}
                     mime="text/csv"
                 )
 
+            # Blade count / EAR from cavitation screening at the design point
+            with timer.stage('Cavitation screening'):
+                from cavitation import recommend, screen, shaft_immersion
+
+                screening = screen(thrust_kn, result['D'], rpm, V_knots, result['P_D'],
+                                   immersion_m=shaft_immersion(draft_m, result['D']))
+                blade_choice = recommend(screening)
+
+            if blade_choice:
+                blade_advice = (f"{blade_choice[0]}-blade configuration with EAR ≥ {blade_choice[1]:.2f} "
+                                f"passes Keller/Burrill cavitation screening (σ0.7R = {screening['sigma_07R']:.3f})")
+            else:
+                blade_advice = (f"no fully submerged 2-6 blade design passes cavitation screening "
+                                f"(σ0.7R = {screening['sigma_07R']:.3f}); a surface-piercing propeller is needed")
+
             # Recommendations
             st.subheader("💡 Recommendations")
             st.write(f"""
             Based on the optimization results:
 
             - ✅ **Propeller Type**: Surface-piercing propeller recommended for speeds above 28 knots
-            - ✅ **Blade Count**: 3-blade configuration optimal for this application
+            - ✅ **Blade Count**: {blade_advice}
             - ✅ **Material**: Consider bronze or stainless steel for durability
             - ✅ **Next Steps**: Conduct model testing to validate design
             - ⚠️ **Note**: This is preliminary design - consult marine engineers before manufacturing
             """)
 
+            # Timing breakdown (opt-in)
+            if show_timing:
+                st.subheader("⏱️ Timing Breakdown")
+                stages = timer.summary()['stages']
+                timing_df = pd.DataFrame({
+                    'Stage': list(stages),
+                    'Calls': [stage['calls'] for stage in stages.values()],
+                    'Time (ms)': [f"{stage['total_s'] * 1000:.1f}" for stage in stages.values()]
+                })
+                st.dataframe(timing_df, use_container_width=True, hide_index=True)
+
+                queue_metrics = job_queue.metrics()
+                st.caption(
+                    f"Job queue: {queue_metrics['queue_depth']} queued, {queue_metrics['running']} running, "
+                    f"{queue_metrics['completed']} completed, {queue_metrics['cache_hits']} cache hits, "
+                    f"{queue_metrics['deduplicated']} deduplicated"
+                    + (f", p95 latency {queue_metrics['latency_s_p95']:.2f} s" if 'latency_s_p95' in queue_metrics else "")
+                )
+                st.download_button(
+                    label="⏱️ Download Timing Trace (Chrome JSON)",
+                    data=timer.to_chrome_trace(),
+                    file_name="propeller_timing_trace.json",
+                    mime="application/json"
+                )
+
         except Exception as e:
             st.error(f"❌ Error during optimization: {str(e)}")
             st.info("Please check your input parameters and try again.")
@@ -397,6 +436,7 @@ else:
     # Comparison table
     st.subheader("📊 Why Choose This Tool?")
 
+    import pandas as pd
     comparison_df = pd.DataFrame({
         'Approach': ['CFD Software', 'Model Testing', '🚀 This Tool'],
         'Time': ['2-4 weeks', '1-3 months', '5 minutes'],
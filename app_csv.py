@@ -1,12 +1,16 @@
 """
 Simple CSV-Based Propeller Optimizer Web App
 No complex calculations - just CSV file lookup!
-Works without numpy, scipy, matplotlib!
+Works without matplotlib or the numerical optimizer!
 """
 
 import streamlit as st
-import csv
-from pathlib import Path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from propeller_store import load_propeller_table
+from speed_ranges import SpeedRangeIndex
 
 # Page config
 st.set_page_config(
@@ -20,33 +24,38 @@ st.title("🚢 CSV-Based Propeller Optimizer")
 st.subheader("Simple database lookup - No complex calculations needed!")
 
 # Load CSV database
-@st.cache_data
+@st.cache_resource
 def load_propeller_database():
-    """Load propeller database from CSV"""
-    db_file = Path('data/propeller_database.csv')
-    if not db_file.exists():
-        return []
+    """
+    Load propeller database into typed columns, shared by all sessions
 
-    with open(db_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    Memory-maps data/propeller_database.bin when it is up to date with the
+    CSV (see src/propeller_store.py), otherwise parses the CSV.
+    """
+    return load_propeller_table('data/propeller_database.csv')
 
-@st.cache_data
+@st.cache_resource
 def load_speed_ranges():
-    """Load speed ranges from CSV"""
-    file = Path('data/speed_ranges.csv')
-    if not file.exists():
-        return []
+    """Load speed ranges from CSV into a validated interval index"""
+    return SpeedRangeIndex.from_csv('data/speed_ranges.csv')
+
+@st.cache_resource
+def load_vessel_index():
+    """Build the nearest-vessel search index once per server process"""
+    # scipy is only imported once the first search runs
+    from vessel_index import VesselIndex
 
-    with open(file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    return VesselIndex.from_table(load_propeller_database())
 
 # Load data
 propeller_db = load_propeller_database()
-speed_ranges = load_speed_ranges()
+try:
+    speed_ranges = load_speed_ranges()
+except ValueError as e:
+    st.warning(f"⚠️ Ignoring data/speed_ranges.csv: {e}")
+    speed_ranges = SpeedRangeIndex([])
 
-if not propeller_db:
+if propeller_db.empty:
     st.error("⚠️ Database not found! Please ensure data/propeller_database.csv exists")
     st.stop()
 
@@ -57,21 +66,17 @@ st.sidebar.header("📋 Vessel Parameters")
 
 # Show available vessels
 st.sidebar.subheader("Quick Select Vessel:")
-vessel_names = [v['vessel_type'].replace('_', ' ').title() for v in propeller_db]
+vessel_names = list(propeller_db['display_name'])
 selected_vessel = st.sidebar.selectbox("Choose from database:", ["Custom"] + vessel_names)
 
 if selected_vessel != "Custom":
     # Find selected vessel
-    vessel_data = None
-    for v in propeller_db:
-        if v['vessel_type'].replace('_', ' ').title() == selected_vessel:
-            vessel_data = v
-            break
-
-    if vessel_data:
-        speed = float(vessel_data['speed_knots'])
-        displacement = float(vessel_data['displacement_tons'])
-        draft = float(vessel_data['draft_m'])
+    vessel_data = propeller_db[propeller_db['display_name'] == selected_vessel]
+
+    if not vessel_data.empty:
+        speed = float(vessel_data['speed_knots'].iloc[0])
+        displacement = float(vessel_data['displacement_tons'].iloc[0])
+        draft = float(vessel_data['draft_m'].iloc[0])
     else:
         speed = 30.0
         displacement = 10.0
@@ -86,6 +91,13 @@ st.sidebar.subheader("Or Enter Custom Values:")
 speed = st.sidebar.slider("Speed (knots)", 10.0, 80.0, speed, 1.0)
 displacement = st.sidebar.number_input("Displacement (tons)", 1.0, 50.0, displacement, 0.5)
 draft = st.sidebar.number_input("Draft (m)", 0.3, 3.0, draft, 0.1)
+if len(propeller_db) > 1:
+    neighbours = st.sidebar.slider("Nearest vessels to blend", 1, min(10, len(propeller_db)),
+                                   min(3, len(propeller_db)),
+                                   help="Specifications are interpolated from this many closest vessels, weighted by inverse distance")
+else:
+    # A slider needs min < max; with one vessel there is nothing to blend
+    neighbours = 1
 
 # Find button
 if st.sidebar.button("🔍 FIND PROPELLER", type="primary"):
@@ -98,34 +110,30 @@ if st.session_state.get('search_done', False):
     st.markdown("---")
     st.subheader("🎯 Search Results")
 
-    # Find similar vessel
-    best_match = None
-    min_diff = float('inf')
-
-    for vessel in propeller_db:
-        speed_diff = abs(float(vessel['speed_knots']) - speed)
-        disp_diff = abs(float(vessel['displacement_tons']) - displacement)
-        draft_diff = abs(float(vessel['draft_m']) - draft)
+    # Find similar vessel (weighted distance: speed*2 + displacement*1 + draft*3)
+    from vessel_index import INTERPOLATED_COLUMNS, interpolate, match_quality
 
-        difference = speed_diff * 2.0 + disp_diff * 1.0 + draft_diff * 3.0
+    vessel_index = load_vessel_index()
+    distances, positions = vessel_index.nearest(speed, displacement, draft, k=neighbours)
+    best_match = propeller_db.iloc[positions[0]]
+    min_diff = distances[0]
+    blended = dict(zip(INTERPOLATED_COLUMNS, interpolate(
+        propeller_db[INTERPOLATED_COLUMNS].to_numpy(), distances[None, :], positions[None, :]
+    )[0]))
 
-        if difference < min_diff:
-            min_diff = difference
-            best_match = vessel
-
-    if best_match:
+    if best_match is not None:
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            st.metric("Match Found", best_match['vessel_type'].replace('_', ' ').title())
-            st.metric("Match Quality", "Excellent" if min_diff < 5 else "Good")
+            st.metric("Match Found", best_match['display_name'])
+            st.metric("Match Quality", match_quality(min_diff), f"distance {min_diff:.1f}", delta_color="off")
 
         with col2:
-            st.metric("Database Speed", f"{best_match['speed_knots']} knots")
+            st.metric("Database Speed", f"{best_match['speed_knots']:g} knots")
             st.metric("Your Speed", f"{speed:.1f} knots")
 
         with col3:
-            st.metric("Database Displacement", f"{best_match['displacement_tons']} tons")
+            st.metric("Database Displacement", f"{best_match['displacement_tons']:g} tons")
             st.metric("Your Displacement", f"{displacement:.1f} tons")
 
         st.markdown("---")
@@ -135,24 +143,47 @@ if st.session_state.get('search_done', False):
         col_a, col_b, col_c, col_d, col_e = st.columns(5)
 
         with col_a:
-            diameter_m = float(best_match['diameter_m'])
+            diameter_m = best_match['diameter_m']
             st.metric("Diameter", f"{diameter_m:.2f} m",
                      f"{diameter_m * 39.37:.1f} inches")
 
         with col_b:
-            st.metric("Pitch Ratio", f"{best_match['pitch_ratio']}")
+            st.metric("Pitch Ratio", f"{best_match['pitch_ratio']:.2f}")
 
         with col_c:
-            efficiency = float(best_match['efficiency'])
+            efficiency = best_match['efficiency']
             st.metric("Efficiency", f"{efficiency:.3f}",
                      f"{efficiency*100:.1f}%")
 
         with col_d:
-            st.metric("Blade Count", best_match['blade_count'])
+            st.metric("Blade Count", int(best_match['blade_count']))
 
         with col_e:
             st.metric("Material", best_match['material'].title())
 
+        if len(positions) > 1:
+            st.markdown("---")
+            st.subheader(f"🧮 Interpolated from {len(positions)} Nearest Vessels")
+
+            blend_a, blend_b, blend_c, blend_d, blend_e = st.columns(5)
+            blend_a.metric("Diameter", f"{blended['diameter_m']:.2f} m")
+            blend_b.metric("Pitch Ratio", f"{blended['pitch_ratio']:.2f}")
+            blend_c.metric("KT", f"{blended['kt']:.3f}")
+            blend_d.metric("KQ", f"{blended['kq']:.4f}")
+            blend_e.metric("Efficiency", f"{blended['efficiency']:.3f}")
+
+            import pandas as pd
+
+            nearest_rows = propeller_db.iloc[positions]
+            st.dataframe(pd.DataFrame({
+                'Vessel Type': nearest_rows['display_name'].to_numpy(),
+                'Distance': distances.round(2),
+                'Match Quality': [match_quality(distance) for distance in distances],
+                'Diameter (m)': nearest_rows['diameter_m'].to_numpy(),
+                'Pitch Ratio': nearest_rows['pitch_ratio'].to_numpy(),
+                'Efficiency': nearest_rows['efficiency'].to_numpy(),
+            }), use_container_width=True, hide_index=True)
+
         # Additional info
         st.markdown("---")
         st.subheader("📝 Additional Information")
@@ -161,21 +192,17 @@ if st.session_state.get('search_done', False):
 
         with info_col1:
             st.write("**Performance Data:**")
-            st.write(f"- KT (Thrust Coefficient): {best_match['kt']}")
-            st.write(f"- KQ (Torque Coefficient): {best_match['kq']}")
+            st.write(f"- KT (Thrust Coefficient): {best_match['kt']:g}")
+            st.write(f"- KQ (Torque Coefficient): {best_match['kq']:g}")
             st.write(f"- RPM: {best_match['rpm']}")
-            st.write(f"- Power: {best_match['power_kw']} kW")
+            st.write(f"- Power: {best_match['power_kw']:g} kW")
 
         with info_col2:
             st.write("**Design Notes:**")
             st.info(best_match['notes'])
 
         # Speed category
-        speed_cat = None
-        for cat in speed_ranges:
-            if float(cat['min_speed']) <= speed <= float(cat['max_speed']):
-                speed_cat = cat
-                break
+        speed_cat = speed_ranges.lookup(speed)
 
         if speed_cat:
             st.markdown("---")
@@ -210,23 +237,31 @@ Draft:          {draft:.2f} m
 
 Matched Vessel:
 ---------------
-Type:           {best_match['vessel_type'].replace('_', ' ').title()}
-Match Quality:  {"Excellent" if min_diff < 5 else "Good"}
+Type:           {best_match['display_name']}
+Match Quality:  {match_quality(min_diff)} (distance {min_diff:.1f})
 
 Propeller Specifications:
 -------------------------
-Diameter:       {best_match['diameter_m']} m ({float(best_match['diameter_m']) * 39.37:.1f} inches)
-Pitch Ratio:    {best_match['pitch_ratio']}
-Efficiency:     {best_match['efficiency']} ({float(best_match['efficiency'])*100:.1f}%)
+Diameter:       {best_match['diameter_m']:.2f} m ({best_match['diameter_m'] * 39.37:.1f} inches)
+Pitch Ratio:    {best_match['pitch_ratio']:.2f}
+Efficiency:     {best_match['efficiency']:.3f} ({best_match['efficiency']*100:.1f}%)
 Blade Count:    {best_match['blade_count']}
 Material:       {best_match['material']}
 
 Performance:
 -----------
-KT:             {best_match['kt']}
-KQ:             {best_match['kq']}
+KT:             {best_match['kt']:g}
+KQ:             {best_match['kq']:g}
 RPM:            {best_match['rpm']}
-Power:          {best_match['power_kw']} kW
+Power:          {best_match['power_kw']:g} kW
+
+Interpolated ({len(positions)} nearest vessels):
+-------------------------------------
+Diameter:       {blended['diameter_m']:.2f} m
+Pitch Ratio:    {blended['pitch_ratio']:.2f}
+KT:             {blended['kt']:.3f}
+KQ:             {blended['kq']:.4f}
+Efficiency:     {blended['efficiency']:.3f}
 
 Notes: {best_match['notes']}
 
@@ -251,19 +286,15 @@ else:
     # Show database as table
     import pandas as pd
 
-    # Convert to display format
-    display_data = []
-    for v in propeller_db:
-        display_data.append({
-            'Vessel Type': v['vessel_type'].replace('_', ' ').title(),
-            'Speed (knots)': v['speed_knots'],
-            'Displacement (tons)': v['displacement_tons'],
-            'Diameter (m)': v['diameter_m'],
-            'Efficiency': f"{float(v['efficiency'])*100:.1f}%",
-            'Material': v['material'].title()
-        })
-
-    df = pd.DataFrame(display_data)
+    # Convert to display format (column-wise, no per-row parsing)
+    df = pd.DataFrame({
+        'Vessel Type': propeller_db['display_name'],
+        'Speed (knots)': propeller_db['speed_knots'],
+        'Displacement (tons)': propeller_db['displacement_tons'],
+        'Diameter (m)': propeller_db['diameter_m'],
+        'Efficiency': (propeller_db['efficiency'] * 100).map('{:.1f}%'.format),
+        'Material': propeller_db['material'].str.title()
+    })
     st.dataframe(df, use_container_width=True, hide_index=True)
 
     st.markdown("---")
@@ -283,10 +314,11 @@ else:
     with col2:
         st.markdown("""
         ### 2️⃣ Smart Matching
-        Finds most similar vessel
+        Finds the most similar vessels
         - Speed matching
         - Displacement matching
         - Draft matching
+        - Blends the closest designs
         """)
 
     with col3:
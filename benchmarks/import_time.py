@@ -0,0 +1,72 @@
+"""
+Import-time benchmark for the Propeller Optimizer
+Measures the cold import cost of each module the apps load, in a fresh
+interpreter per module, using Python's -X importtime report
+
+Example:
+    python benchmarks/import_time.py --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Third-party modules first, then the project's own modules in src/
+MODULES = [
+    'streamlit',
+    'numpy',
+    'pandas',
+    'scipy.optimize',
+    'scipy.spatial',
+    'matplotlib.pyplot',
+    'plotly.graph_objects',
+    'optimizer',
+    'result_cache',
+    'instrumentation',
+    'jobs',
+    'figures',
+    'propeller_store',
+    'vessel_index',
+]
+
+
+def import_time_us(module):
+    """Cumulative import time of `module` in microseconds, or None if it fails to import"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        return None
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report cold import cost per module")
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh interpreters per module (median is reported)")
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    args = parser.parse_args()
+
+    print(f"{'Module':<24}{'Import time (ms)':>18}")
+    print('-' * 42)
+    for module in args.modules:
+        samples = [import_time_us(module) for _ in range(args.repeat)]
+        if None in samples:
+            print(f"{module:<24}{'not importable':>18}")
+        else:
+            print(f"{module:<24}{statistics.median(samples) / 1000:>18.1f}")
+
+
+if __name__ == '__main__':
+    main()
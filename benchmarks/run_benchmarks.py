@@ -0,0 +1,222 @@
+"""
+Benchmark suite for the Propeller Optimizer
+Covers single-design latency for the README presets, batch throughput,
+nearest-vessel matching from 10 to 10^6 database rows and database load
+time. Results are saved as JSON per commit so runs can be compared.
+
+Examples:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --quick --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.append(os.path.join(ROOT_DIR, 'src'))
+
+import numpy as np
+
+from synthetic import make_database, make_queries
+
+# Preset vessels from the Streamlit app / README
+PRESETS = {
+    'patrol_boat': {'V_knots': 58.0, 'displacement_t': 9.72, 'draft_m': 0.65, 'power_kw': 1045.0, 'rpm': 2233},
+    'racing_yacht': {'V_knots': 45.0, 'displacement_t': 5.5, 'draft_m': 0.50, 'power_kw': 650.0, 'rpm': 2500},
+    'fishing_vessel': {'V_knots': 25.0, 'displacement_t': 15.0, 'draft_m': 1.2, 'power_kw': 450.0, 'rpm': 1800},
+    'cruise_boat': {'V_knots': 35.0, 'displacement_t': 12.0, 'draft_m': 0.85, 'power_kw': 800.0, 'rpm': 2100},
+}
+
+DATABASE_SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+QUICK_DATABASE_SIZES = [10, 100, 1000, 10000]
+
+# The old row-by-row scan is only timed up to this size
+LINEAR_SCAN_MAX_ROWS = 10000
+
+
+def timed(func, repeat):
+    """Median and minimum wall time of `repeat` calls, in seconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {'median_s': statistics.median(samples), 'min_s': min(samples), 'repeat': repeat}
+
+
+def bench_presets(repeat):
+    from optimizer import run_optimization
+
+    return {name: timed(lambda: run_optimization(params), repeat) for name, params in PRESETS.items()}
+
+
+def bench_batch(n, repeat):
+    import pandas as pd
+
+    from batch import run_optimization_batch
+
+    rng = np.random.default_rng(2)
+    specs = pd.DataFrame({
+        'V_knots': rng.uniform(20, 65, n),
+        'displacement_t': rng.uniform(3, 30, n),
+        'draft_m': rng.uniform(0.4, 1.5, n),
+        'power_kw': rng.uniform(300, 2000, n),
+        'rpm': rng.integers(30, 50, n) * 50,
+    })
+    result = timed(lambda: run_optimization_batch(specs), repeat)
+    result['designs'] = n
+    result['designs_per_s'] = n / result['median_s']
+    return result
+
+
+def read_csv_rows(path):
+    """The original list-of-dicts loader"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def linear_scan(rows, speed, displacement, draft):
+    """The original app_csv.py matching loop, kept as a baseline"""
+    best_match, min_diff = None, float('inf')
+    for vessel in rows:
+        difference = (abs(float(vessel['speed_knots']) - speed) * 2.0
+                      + abs(float(vessel['displacement_tons']) - displacement) * 1.0
+                      + abs(float(vessel['draft_m']) - draft) * 3.0)
+        if difference < min_diff:
+            min_diff, best_match = difference, vessel
+    return best_match
+
+
+def bench_database(sizes, repeat, data_dir):
+    from propeller_store import convert_to_binary, load_propeller_table
+    from vessel_index import VesselIndex
+
+    queries = make_queries(1000)
+    results = {}
+    for n in sizes:
+        path = os.path.join(data_dir, f"propeller_database_{n}.csv")
+        if not os.path.exists(path):
+            make_database(path, n)
+
+        entry = {'rows': n}
+        entry['load_csv_dicts'] = timed(lambda: read_csv_rows(path), repeat)
+        entry['load_typed_table'] = timed(lambda: load_propeller_table(path, prefer_binary=False), repeat)
+        convert_to_binary(path)
+        entry['load_binary'] = timed(lambda: load_propeller_table(path), repeat)
+
+        table = load_propeller_table(path)
+        entry['index_build'] = timed(lambda: VesselIndex.from_table(table), repeat)
+
+        index = VesselIndex.from_table(table)
+        query_timing = timed(lambda: [index.nearest(*query) for query in queries], repeat)
+        entry['index_query_us'] = query_timing['median_s'] / len(queries) * 1e6
+        speeds, displacements, drafts = queries.T
+        batch_timing = timed(lambda: index.nearest_many(speeds, displacements, drafts, k=5), repeat)
+        entry['index_query_batch_k5_us'] = batch_timing['median_s'] / len(queries) * 1e6
+
+        if n <= LINEAR_SCAN_MAX_ROWS:
+            rows = read_csv_rows(path)
+            scan_queries = queries[:20]
+            scan_timing = timed(lambda: [linear_scan(rows, *query) for query in scan_queries], repeat)
+            entry['linear_scan_query_us'] = scan_timing['median_s'] / len(scan_queries) * 1e6
+
+        results[str(n)] = entry
+        print(f"  {n:>8} rows: load {entry['load_typed_table']['median_s'] * 1000:8.1f} ms "
+              f"(binary {entry['load_binary']['median_s'] * 1000:6.1f} ms), "
+              f"query {entry['index_query_us']:8.1f} us")
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def flatten(results, prefix=''):
+    """Flatten nested results into {'a.b.median_s': value} for comparison"""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and name.endswith(('_s', '_us')):
+            flat[name] = value
+    return flat
+
+
+def compare(current, baseline_path):
+    """Print timing ratios against a saved run (>1.00x means slower now)"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    old, new = flatten(baseline['results']), flatten(current['results'])
+    print(f"\nComparison against {baseline['revision']} ({baseline_path}):")
+    for name in sorted(set(old) & set(new)):
+        if name.endswith('min_s'):
+            continue
+        ratio = new[name] / old[name] if old[name] else float('inf')
+        flag = '  <-- slower' if ratio > 1.2 else ''
+        print(f"  {name:<60} {ratio:6.2f}x{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Propeller Optimizer benchmarks")
+    parser.add_argument('--quick', action='store_true', help="Smaller databases and fewer repeats")
+    parser.add_argument('--repeat', type=int, default=None)
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'propeller-bench'),
+                        help="Where synthetic databases are generated (reused between runs)")
+    parser.add_argument('--output', default=None, help="Results file (default: benchmarks/results/<rev>.json)")
+    parser.add_argument('--compare', default=None, help="Saved results file to compare against")
+    args = parser.parse_args()
+
+    repeat = args.repeat or (3 if args.quick else 5)
+    sizes = QUICK_DATABASE_SIZES if args.quick else DATABASE_SIZES
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    revision = git_revision()
+    results = {}
+
+    print("Optimizer presets...")
+    try:
+        results['presets'] = bench_presets(repeat)
+        results['batch'] = bench_batch(args.batch_size, max(1, repeat // 2))
+    except ImportError as e:
+        print(f"  skipped: {e}")
+
+    print("Database load and nearest-vessel matching...")
+    results['database'] = bench_database(sizes, repeat, args.data_dir)
+
+    report = {
+        'revision': revision,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'results': results,
+    }
+
+    output = args.output or os.path.join(BENCH_DIR, 'results', f"{revision}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Load generator for the Propeller Optimizer HTTP service
+Fires concurrent JSON requests at a running service and reports throughput
+and latency percentiles (standard library only)
+
+Example:
+    uvicorn service:app --app-dir src --port 8000 &
+    python benchmarks/service_load.py --endpoint optimize --concurrency 16 --requests 500 --batch 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+def make_payload(endpoint, rng):
+    """Random vessel spec within the app's input limits"""
+    if endpoint == 'match':
+        return {
+            'speed': rng.uniform(10, 80),
+            'displacement': rng.uniform(1, 50),
+            'draft': rng.uniform(0.3, 3.0),
+            'k': 3,
+        }
+    if endpoint == 'predict-speed':
+        return {
+            'power_kw': rng.uniform(100, 5000),
+            'displacement_t': rng.uniform(1, 50),
+            'beam_m': rng.uniform(1.5, 5.0),
+            'loa_m': rng.uniform(6, 30),
+        }
+    return {
+        'V_knots': rng.uniform(10, 80),
+        'displacement_t': rng.uniform(1, 100),
+        'draft_m': rng.uniform(0.3, 3.0),
+        'power_kw': rng.uniform(100, 5000),
+        'rpm': rng.randrange(500, 4000, 50),
+    }
+
+
+async def post(host, port, path, payload):
+    """Send one HTTP/1.1 POST and return (status, seconds)"""
+    body = json.dumps(payload).encode('utf-8')
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('ascii') + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    status = int(response.split(b' ', 2)[1])
+    return status, time.perf_counter() - started
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    queue = asyncio.Queue()
+    for _ in range(args.requests):
+        if args.batch > 1:
+            queue.put_nowait([make_payload(args.endpoint, rng) for _ in range(args.batch)])
+        else:
+            queue.put_nowait(make_payload(args.endpoint, rng))
+
+    latencies, errors = [], 0
+
+    async def client():
+        nonlocal errors
+        while not queue.empty():
+            payload = queue.get_nowait()
+            status, seconds = await post(args.host, args.port, f"/{args.endpoint}", payload)
+            latencies.append(seconds)
+            if status != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(args.concurrency)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    items = args.requests * max(args.batch, 1)
+    print(f"{args.requests} requests ({items} designs) in {elapsed:.2f} s, {errors} errors")
+    print(f"Throughput: {args.requests / elapsed:.1f} req/s, {items / elapsed:.1f} designs/s")
+    for pct in (50, 90, 99):
+        print(f"p{pct} latency: {latencies[min(len(latencies) - 1, len(latencies) * pct // 100)] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Propeller Optimizer HTTP service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--endpoint', choices=['optimize', 'size-diameter', 'predict-speed', 'match'],
+                        default='optimize')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch', type=int, default=1, help="Designs per request body (1 = single object)")
+    parser.add_argument('--seed', type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
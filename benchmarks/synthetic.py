@@ -0,0 +1,56 @@
+"""
+Deterministic synthetic propeller databases for benchmarks
+Same seed and size always produce the same propeller_database.csv
+"""
+
+import csv
+
+import numpy as np
+
+FIELDS = [
+    'vessel_type', 'speed_knots', 'displacement_tons', 'draft_m', 'beam_m', 'power_kw', 'rpm',
+    'diameter_m', 'pitch_ratio', 'kt', 'kq', 'efficiency', 'blade_count', 'material', 'notes'
+]
+
+VESSEL_TYPES = [
+    'patrol_boat', 'racing_yacht', 'fishing_vessel', 'cruise_boat', 'sport_boat',
+    'trawler', 'pilot_boat', 'water_taxi', 'rescue_boat', 'cargo_boat'
+]
+MATERIALS = ['bronze', 'stainless', 'aluminum', 'nibral', 'composite']
+
+
+def make_database(path, n, seed=0):
+    """Write an n-row propeller_database.csv with plausible values to `path`"""
+    rng = np.random.default_rng(seed)
+    speed = rng.uniform(10, 80, n)
+    displacement = rng.uniform(1, 50, n)
+    draft = rng.uniform(0.3, 3.0, n)
+    beam = rng.uniform(2.0, 5.0, n)
+    power = rng.uniform(100, 5000, n)
+    rpm = rng.integers(10, 80, n) * 50
+    diameter = np.minimum(draft * 0.9, rng.uniform(0.3, 1.5, n))
+    pitch_ratio = rng.uniform(0.8, 1.7, n)
+    kt = rng.uniform(0.1, 0.3, n)
+    kq = rng.uniform(0.02, 0.05, n)
+    efficiency = rng.uniform(0.5, 0.75, n)
+    blades = rng.integers(2, 7, n)
+    vessel = rng.integers(0, len(VESSEL_TYPES), n)
+    material = rng.integers(0, len(MATERIALS), n)
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for i in range(n):
+            writer.writerow([
+                VESSEL_TYPES[vessel[i]], f"{speed[i]:.1f}", f"{displacement[i]:.2f}", f"{draft[i]:.2f}",
+                f"{beam[i]:.2f}", f"{power[i]:.0f}", rpm[i], f"{diameter[i]:.2f}", f"{pitch_ratio[i]:.2f}",
+                f"{kt[i]:.3f}", f"{kq[i]:.3f}", f"{efficiency[i]:.3f}", blades[i],
+                MATERIALS[material[i]], f"Synthetic vessel {i}"
+            ])
+    return path
+
+
+def make_queries(n, seed=1):
+    """(n, 3) array of (speed, displacement, draft) query vessels"""
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(10, 80, n), rng.uniform(1, 50, n), rng.uniform(0.3, 3.0, n)])
@@ -0,0 +1,56 @@
+"""
+Batch API for the Propeller Optimizer
+Runs a whole fleet of vessel specs through the optimizer in one call
+"""
+
+import numpy as np
+import pandas as pd
+
+# Vessel spec fields expected by run_optimization (same keys app.py sends)
+INPUT_COLUMNS = ['V_knots', 'displacement_t', 'draft_m', 'power_kw', 'rpm']
+
+# Design fields returned for every vessel
+RESULT_COLUMNS = ['D', 'P_D', 'KT', 'KQ', 'eta']
+
+
+def spec_matrix(specs):
+    """Convert a DataFrame or structured NumPy array of vessel specs to an (N, 5) float array"""
+    if isinstance(specs, pd.DataFrame):
+        names = list(specs.columns)
+    elif isinstance(specs, np.ndarray) and specs.dtype.names:
+        names = list(specs.dtype.names)
+    else:
+        raise TypeError("Vessel specs must be a pandas DataFrame or a structured NumPy array")
+
+    missing = [col for col in INPUT_COLUMNS if col not in names]
+    if missing:
+        raise ValueError(f"Vessel specs are missing required columns: {', '.join(missing)}")
+
+    return np.column_stack([np.asarray(specs[col], dtype=float) for col in INPUT_COLUMNS])
+
+
+def run_optimization_batch(specs):
+    """
+    Optimize every vessel in `specs` and return a DataFrame of D, P_D, KT, KQ and eta
+
+    Rows are returned in input order (keeping a DataFrame's index). Identical
+    vessel specs are only optimized once, which is common when a design review
+    sweeps engine variants over a handful of hulls.
+    """
+    from optimizer import run_optimization
+
+    matrix = spec_matrix(specs)
+    index = specs.index if isinstance(specs, pd.DataFrame) else pd.RangeIndex(len(matrix))
+
+    if len(matrix) == 0:
+        return pd.DataFrame(columns=RESULT_COLUMNS, index=index, dtype=float)
+
+    unique_specs, inverse = np.unique(matrix, axis=0, return_inverse=True)
+
+    unique_results = np.empty((len(unique_specs), len(RESULT_COLUMNS)))
+    for i, row in enumerate(unique_specs):
+        params = dict(zip(INPUT_COLUMNS, row.tolist()))
+        result = run_optimization(params)
+        unique_results[i] = [result[col] for col in RESULT_COLUMNS]
+
+    return pd.DataFrame(unique_results[inverse.ravel()], columns=RESULT_COLUMNS, index=index)
@@ -0,0 +1,219 @@
+"""
+Headless batch runner for the Propeller Optimizer
+Streams vessel specs in (CSV or JSON Lines) and designs out (CSV, JSON Lines
+or a TXT report)
+
+Examples:
+    python src/batch_cli.py fleet.csv -o designs.csv --workers 8
+    cat fleet.jsonl | python src/batch_cli.py --format jsonl --engine csv --order completed
+    python src/batch_cli.py fleet.csv --report txt -o fleet_report.txt
+"""
+
+import argparse
+import collections
+import csv
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from batch import INPUT_COLUMNS
+from reports import RESULT_FIELDS, optimizer_row, write_report
+from speed_ranges import SpeedRangeIndex
+
+# Per-process engine state, filled in by _init_worker
+_worker = {}
+
+# Output field -> propeller database column, for the CSV engine
+DATABASE_FIELDS = {
+    'diameter_m': 'diameter_m',
+    'pitch_ratio': 'pitch_ratio',
+    'kt': 'kt',
+    'kq': 'kq',
+    'efficiency': 'efficiency',
+    'blade_count': 'blade_count',
+    'material': 'material',
+    'similar_vessel': 'vessel_type',
+    'notes': 'notes',
+}
+
+
+def read_specs(stream, fmt):
+    """Yield vessel spec dicts one at a time from a CSV or JSON Lines stream"""
+    if fmt == 'csv':
+        for row in csv.DictReader(stream):
+            yield row
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _init_worker(engine, database_path, speed_ranges_path):
+    """Load the solver and data tables once per worker process"""
+    _worker['engine'] = engine
+    _worker['speed_ranges'] = SpeedRangeIndex.from_csv(speed_ranges_path)
+
+    if engine == 'optimizer':
+        from optimizer import run_optimization
+        _worker['run_optimization'] = run_optimization
+    else:
+        from propeller_store import load_propeller_table
+        from vessel_index import VesselIndex
+        table = load_propeller_table(database_path)
+        if table.empty:
+            raise FileNotFoundError(f"Propeller database not found: {database_path}")
+        _worker['table'] = table
+        _worker['index'] = VesselIndex.from_table(table)
+
+
+def _table_value(value):
+    """A database cell as a plain Python value; missing cells become '' like other empty fields"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return ''
+    return value
+
+
+def _design(spec):
+    """Design one propeller and return it as an output row"""
+    params = {name: float(spec[name]) for name in INPUT_COLUMNS if name in spec}
+    category = _worker['speed_ranges'].lookup(params['V_knots']) or {}
+
+    if _worker['engine'] == 'optimizer':
+        row = optimizer_row(_worker['run_optimization'](params))
+        row['blade_count'] = category.get('recommended_blade_count', '')
+    else:
+        from vessel_index import match_quality
+
+        row = dict.fromkeys(RESULT_FIELDS, '')
+        distances, positions = _worker['index'].nearest(
+            params['V_knots'], params['displacement_t'], params['draft_m']
+        )
+        match = _worker['table'].iloc[positions[0]]
+        row.update({name: _table_value(match[column]) for name, column in DATABASE_FIELDS.items()})
+        row['match_quality'] = match_quality(distances[0])
+        row['source'] = 'CSV Database'
+
+    row['propeller_type'] = category.get('propeller_type', '')
+    row['cavitation_risk'] = category.get('cavitation_risk', '')
+    row['diameter_inches'] = float(row['diameter_m']) * 39.37
+    return row
+
+
+def _design_chunk(chunk):
+    """Design every (input_row, spec) pair in a chunk; failures become error rows"""
+    designs = []
+    for input_row, spec in chunk:
+        try:
+            row = _design(spec)
+        except Exception as e:
+            row = dict.fromkeys(RESULT_FIELDS, '')
+            row.update({'source': 'Error', 'notes': f"{type(e).__name__}: {e}"})
+        row['input_row'] = input_row
+        designs.append((spec, row))
+    return designs
+
+
+def _chunks(specs, chunk_size):
+    """Group specs into lists of (input_row, spec) pairs without reading ahead"""
+    chunk = []
+    for input_row, spec in enumerate(specs):
+        chunk.append((input_row, spec))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(specs, workers=None, order='input', chunk_size=64, engine='optimizer',
+              database_path='data/propeller_database.csv', speed_ranges_path='data/speed_ranges.csv'):
+    """
+    Yield (spec, output row) pairs for a stream of vessel specs
+
+    At most two chunks per worker are in flight at any time, so memory stays
+    flat however long the input is. With order='input' designs come back in
+    input order; with order='completed' they come back as soon as a chunk is
+    done, and each row's `input_row` says which spec it belongs to.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    chunks = _chunks(specs, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine, database_path, speed_ranges_path)) as pool:
+        pending = collections.deque()
+
+        def submit_next():
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append(pool.submit(_design_chunk, chunk))
+            return True
+
+        while len(pending) < max_in_flight and submit_next():
+            pass
+
+        while pending:
+            if order == 'input':
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+
+            for future in done:
+                yield from future.result()
+                submit_next()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch propeller design: vessel specs in, designs out")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="CSV or JSON Lines file of vessel specs ('-' for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="Output file ('-' for stdout)")
+    parser.add_argument('--report', choices=['csv', 'jsonl', 'txt'], default='csv',
+                        help="Output format: result CSV, JSON Lines with inputs, or per-vessel TXT report")
+    parser.add_argument('--format', choices=['csv', 'jsonl'],
+                        help="Input format (default: from file extension, csv for stdin)")
+    parser.add_argument('--engine', choices=['optimizer', 'csv'], default='optimizer',
+                        help="Gawn-Burrill optimizer or CSV database matching")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--order', choices=['input', 'completed'], default='input',
+                        help="Emit rows in input order or as they complete")
+    parser.add_argument('--chunk-size', type=int, default=64, help="Specs sent to a worker at a time")
+    parser.add_argument('--database', default='data/propeller_database.csv')
+    parser.add_argument('--speed-ranges', default='data/speed_ranges.csv')
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = 'jsonl' if args.input.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+    in_stream = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8', newline='')
+    out_stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+
+    options = {}
+    if args.report == 'csv' and args.order == 'completed':
+        options['fields'] = ['input_row'] + RESULT_FIELDS
+    elif args.report == 'txt':
+        options['generated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        designs = run_batch(read_specs(in_stream, fmt), workers=args.workers, order=args.order,
+                            chunk_size=args.chunk_size, engine=args.engine,
+                            database_path=args.database, speed_ranges_path=args.speed_ranges)
+        write_report(designs, out_stream, args.report, flush=True, **options)
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Cavitation screening for blade count and expanded-area ratio (EAR)
+Evaluates Keller's minimum-EAR criterion and a Burrill-style thrust-loading
+check over a whole (Z x EAR) grid at once, so only feasible candidates need
+the expensive KT/KQ evaluation
+"""
+
+import numpy as np
+
+RHO = 1025.0               # sea water density, kg/m^3
+G = 9.81
+KNOT = 0.514444            # m/s per knot
+ATMOSPHERIC_PA = 101325.0
+VAPOUR_PA = 1700.0         # sea water vapour pressure at 15 C
+
+BLADE_COUNTS = (2, 3, 4, 5, 6)
+EAR_GRID = np.round(np.arange(0.30, 1.2001, 0.01), 2)
+
+# Keller's constant: 0.2 for single-screw, 0 to 0.1 for twin-screw vessels
+KELLER_K_SINGLE = 0.2
+KELLER_K_TWIN = 0.1
+
+# Burrill's upper limit for 5% back cavitation, approximated as
+# tau_c = 0.28 sigma_0.7R^0.48 (read off the published diagram)
+BURRILL_COEFFICIENT = 0.28
+BURRILL_EXPONENT = 0.48
+
+
+def static_pressure(immersion_m):
+    """p0 - pv at the shaft centreline, in Pa"""
+    return ATMOSPHERIC_PA + RHO * G * np.asarray(immersion_m, dtype=float) - VAPOUR_PA
+
+
+def shaft_immersion(draft_m, diameter_m):
+    """
+    Shaft centreline depth for a propeller whose tips reach the draft line
+
+    draft - D/2, floored at 0 for a propeller larger than twice the draft
+    (its centreline then sits at the surface, as for a surface piercer).
+    """
+    return np.maximum(np.asarray(draft_m, dtype=float) - np.asarray(diameter_m, dtype=float) / 2, 0.0)
+
+
+def keller_min_ear(thrust_kn, diameter_m, immersion_m, blade_counts=BLADE_COUNTS, keller_k=KELLER_K_SINGLE):
+    """Keller: EAR_min = (1.3 + 0.3 Z) T / ((p0 - pv) D^2) + K, one value per blade count"""
+    z = np.asarray(blade_counts, dtype=float)
+    thrust = np.asarray(thrust_kn, dtype=float) * 1000.0
+    return (1.3 + 0.3 * z) * thrust / (static_pressure(immersion_m) * np.asarray(diameter_m) ** 2) + keller_k
+
+
+def burrill(thrust_kn, diameter_m, rpm, speed_knots, pitch_ratio, ear, immersion_m, wake_fraction=0.0):
+    """
+    Local cavitation number at 0.7R and thrust loading coefficient for each EAR
+
+    V_R^2 = Va^2 + (0.7 pi n D)^2, sigma_0.7R = (p0 - pv) / (0.5 rho V_R^2),
+    tau_c = T / (Ap 0.5 rho V_R^2) with projected area
+    Ap = Ae (1.067 - 0.229 P/D). Returns (sigma_07R, tau_c, tau_c_limit).
+    """
+    ear = np.asarray(ear, dtype=float)
+    n = np.asarray(rpm, dtype=float) / 60.0
+    diameter = np.asarray(diameter_m, dtype=float)
+    advance = np.asarray(speed_knots, dtype=float) * KNOT * (1.0 - wake_fraction)
+
+    dynamic = 0.5 * RHO * (advance ** 2 + (0.7 * np.pi * n * diameter) ** 2)
+    sigma = static_pressure(immersion_m) / dynamic
+
+    projected_area = ear * np.pi * diameter ** 2 / 4 * (1.067 - 0.229 * np.asarray(pitch_ratio, dtype=float))
+    tau_c = np.asarray(thrust_kn, dtype=float) * 1000.0 / (projected_area * dynamic)
+    return sigma, tau_c, BURRILL_COEFFICIENT * sigma ** BURRILL_EXPONENT
+
+
+def screen(thrust_kn, diameter_m, rpm, speed_knots, pitch_ratio, immersion_m,
+           blade_counts=BLADE_COUNTS, ear=EAR_GRID, wake_fraction=0.0, keller_k=KELLER_K_SINGLE):
+    """
+    Screen every (Z, EAR) candidate for one operating point
+
+    A candidate is feasible when its EAR meets Keller's minimum for its blade
+    count and its thrust loading is under the Burrill limit. Returns a dict
+    with the `feasible` (len(blade_counts), len(ear)) mask, the per-Z Keller
+    minimum and smallest feasible EAR (NaN when none), and sigma_0.7R.
+    """
+    blade_counts = np.asarray(blade_counts)
+    ear = np.asarray(ear, dtype=float)
+
+    keller = keller_min_ear(thrust_kn, diameter_m, immersion_m, blade_counts, keller_k)
+    sigma, tau_c, tau_limit = burrill(thrust_kn, diameter_m, rpm, speed_knots, pitch_ratio, ear,
+                                      immersion_m, wake_fraction)
+
+    feasible = (ear[None, :] >= keller[:, None]) & (tau_c <= tau_limit)[None, :]
+    first = feasible.argmax(axis=1)
+    min_ear = np.where(feasible.any(axis=1), ear[first], np.nan)
+
+    return {
+        'blade_counts': blade_counts,
+        'ear': ear,
+        'feasible': feasible,
+        'keller_min_ear': keller,
+        'min_feasible_ear': min_ear,
+        'sigma_07R': float(sigma),
+        'thrust_loading': tau_c,
+        'thrust_loading_limit': float(tau_limit),
+    }
+
+
+def candidates(screening):
+    """Feasible (Z, EAR) pairs from a screen() result, ready for KT/KQ evaluation"""
+    z_index, ear_index = np.nonzero(screening['feasible'])
+    return list(zip(screening['blade_counts'][z_index].tolist(), screening['ear'][ear_index].tolist()))
+
+
+def recommend(screening):
+    """
+    Fewest blades that pass the screen, with the smallest EAR that does
+
+    Returns (blade_count, ear), or None when no candidate in the grid is
+    feasible (the propeller must run ventilated or supercavitating).
+    """
+    for z, min_ear in zip(screening['blade_counts'], screening['min_feasible_ear']):
+        if not np.isnan(min_ear):
+            return int(z), float(min_ear)
+    return None
@@ -0,0 +1,106 @@
+"""
+Result figures for the Propeller Optimizer web app
+Renders the two-panel performance summary as cached PNG bytes (Matplotlib)
+or as an interactive Plotly figure drawn in the browser
+"""
+
+import functools
+import io
+
+# Design parameters shown in the summary charts
+SUMMARY_LABELS = ['D\n(m)', 'P/D', 'KT\n(×10)', 'KQ\n(×100)', 'η']
+
+# Efficiency used as the "Initial Estimate" reference bar
+INITIAL_ETA = 0.55
+
+
+def _summary_values(D, P_D, KT, KQ, eta):
+    return [D, P_D, KT * 10, KQ * 100, eta]
+
+
+def summary_key(result):
+    """Cache key for a result: the values the summary figure depends on"""
+    return tuple(round(float(result[name]), 6) for name in ('D', 'P_D', 'KT', 'KQ', 'eta'))
+
+
+@functools.lru_cache(maxsize=256)
+def render_summary_png(key, dpi=100):
+    """
+    Render the performance summary for `summary_key(result)` to PNG bytes
+
+    The figure is built on a standalone Agg canvas rather than through pyplot,
+    so it is never registered in pyplot's global figure list and is freed as
+    soon as rendering is done. Repeat designs come straight from the cache.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    D, P_D, KT, KQ, eta = key
+    fig = Figure(figsize=(12, 4))
+    FigureCanvasAgg(fig)
+    ax1, ax2 = fig.subplots(1, 2)
+
+    # Plot 1: Efficiency comparison
+    categories = ['Initial\nEstimate', 'After\nOptimization']
+    values = [INITIAL_ETA, eta]
+    colors = ['#ff7f0e', '#2ca02c']
+
+    ax1.bar(categories, values, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
+    ax1.set_ylabel('Efficiency (η)', fontweight='bold')
+    ax1.set_title('Efficiency Improvement', fontweight='bold', fontsize=12)
+    ax1.set_ylim([0, 1.0])
+    ax1.grid(True, alpha=0.3, axis='y')
+
+    # Add value labels
+    for i, v in enumerate(values):
+        ax1.text(i, v + 0.02, f'{v:.3f}\n({v*100:.1f}%)',
+                 ha='center', fontweight='bold')
+
+    # Plot 2: Parameter radar
+    params_values = _summary_values(D, P_D, KT, KQ, eta)
+    x_pos = range(len(SUMMARY_LABELS))
+
+    ax2.bar(x_pos, params_values, color='#1f77b4', alpha=0.7, edgecolor='black', linewidth=2)
+    ax2.set_xticks(list(x_pos))
+    ax2.set_xticklabels(SUMMARY_LABELS, fontsize=10)
+    ax2.set_ylabel('Value', fontweight='bold')
+    ax2.set_title('Optimized Parameters', fontweight='bold', fontsize=12)
+    ax2.grid(True, alpha=0.3, axis='y')
+
+    # Add value labels
+    for i, v in enumerate(params_values):
+        ax2.text(i, v + 0.02, f'{v:.2f}', ha='center', fontweight='bold', fontsize=9)
+
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi)
+    fig.clear()
+    return buffer.getvalue()
+
+
+def summary_plotly(result):
+    """Build the performance summary as a Plotly figure (rendered client-side)"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    D, P_D, KT, KQ, eta = summary_key(result)
+    fig = make_subplots(rows=1, cols=2, subplot_titles=('Efficiency Improvement', 'Optimized Parameters'))
+
+    values = [INITIAL_ETA, eta]
+    fig.add_trace(go.Bar(
+        x=['Initial Estimate', 'After Optimization'], y=values,
+        marker_color=['#ff7f0e', '#2ca02c'], opacity=0.7,
+        text=[f'{v:.3f} ({v*100:.1f}%)' for v in values], textposition='outside'
+    ), row=1, col=1)
+
+    params_values = _summary_values(D, P_D, KT, KQ, eta)
+    fig.add_trace(go.Bar(
+        x=[label.replace('\n', ' ') for label in SUMMARY_LABELS], y=params_values,
+        marker_color='#1f77b4', opacity=0.7,
+        text=[f'{v:.2f}' for v in params_values], textposition='outside'
+    ), row=1, col=2)
+
+    fig.update_yaxes(title_text='Efficiency (η)', range=[0, 1.0], row=1, col=1)
+    fig.update_yaxes(title_text='Value', row=1, col=2)
+    fig.update_layout(showlegend=False, height=400, margin=dict(t=60, b=40))
+    return fig
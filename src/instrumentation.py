@@ -0,0 +1,109 @@
+"""
+Stage-level timing instrumentation for the Propeller Optimizer
+Records wall time per stage, evaluation counters and convergence history,
+and exports them as a dict, JSON or a Chrome trace (chrome://tracing, Perfetto)
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+
+class StageTimer:
+    """
+    Opt-in recorder for pipeline stages
+
+    Use `stage(name)` as a context manager around each step (speed prediction,
+    diameter sizing, KT/KQ evaluation, iteration, sensitivity), `count(name)`
+    for function-evaluation counters and `record(name, value)` for convergence
+    history. A timer created with enabled=False records nothing, so calling
+    code can stay instrumented unconditionally.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.counters = {}
+        self.history = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the enclosed block as one span of stage `name`"""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.spans.append((name, start - self.origin, end - start, threading.get_ident()))
+
+    def count(self, name, n=1):
+        """Add `n` to counter `name` (e.g. KT/KQ evaluations)"""
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def record(self, name, value):
+        """Append `value` to the convergence history `name` (e.g. best eta per iteration)"""
+        if self.enabled:
+            with self._lock:
+                self.history.setdefault(name, []).append(value)
+
+    def wrap(self, name, func):
+        """Return `func` timed as stage `name` and counted on every call"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.count(name)
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def summary(self):
+        """Per-stage totals plus counters and convergence history as a plain dict"""
+        stages = {}
+        for name, _, duration, _ in self.spans:
+            entry = stages.setdefault(name, {'calls': 0, 'total_s': 0.0})
+            entry['calls'] += 1
+            entry['total_s'] += duration
+        for entry in stages.values():
+            entry['mean_s'] = entry['total_s'] / entry['calls']
+
+        return {
+            'stages': stages,
+            'counters': dict(self.counters),
+            'history': {name: list(values) for name, values in self.history.items()},
+        }
+
+    def to_json(self, path=None):
+        """Return the summary as JSON, also writing it to `path` if given"""
+        text = json.dumps(self.summary(), indent=2, default=float)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        return text
+
+    def to_chrome_trace(self, path=None):
+        """Return the spans in Chrome trace-event format, also writing them to `path` if given"""
+        pid = os.getpid()
+        events = [
+            {'name': name, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6, 'pid': pid, 'tid': tid}
+            for name, start, duration, tid in self.spans
+        ]
+        now = (time.perf_counter() - self.origin) * 1e6
+        for name, value in self.counters.items():
+            events.append({'name': name, 'ph': 'C', 'ts': now, 'pid': pid, 'args': {name: value}})
+
+        text = json.dumps({'traceEvents': events})
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        return text
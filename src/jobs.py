@@ -0,0 +1,211 @@
+"""
+Asynchronous job queue for the Propeller Optimizer
+Runs optimization jobs in a shared process pool so Streamlit sessions
+submit work and poll for results instead of blocking a script thread
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+
+def _run_job(func, args, kwargs):
+    """Worker entry point: run one job and report when it actually ran"""
+    started = time.time()
+    result = func(*args, **kwargs)
+    return started, time.time(), result
+
+
+def _request_key(func, args, kwargs):
+    """Identity of a request, used to deduplicate identical in-flight jobs"""
+    payload = json.dumps([func.__module__, func.__qualname__, args, kwargs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class JobQueue:
+    """
+    Process-pool job queue with request deduplication and latency metrics
+
+    `func` must be a module-level function (e.g. optimizer.run_optimization)
+    so it can be sent to worker processes. With a ResultCache, cached answers
+    complete immediately and fresh results are stored when jobs finish.
+    Identical requests submitted while one is still queued or running share
+    that job's id.
+    """
+
+    def __init__(self, func, max_workers=None, cache=None, max_finished=1000, latency_window=500):
+        self.func = func
+        self.cache = cache
+        self.max_finished = max_finished
+        self.max_workers = max_workers
+
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._jobs = collections.OrderedDict()
+        self._inflight = {}
+        self._latencies = collections.deque(maxlen=latency_window)
+        self._counts = {'submitted': 0, 'deduplicated': 0, 'cache_hits': 0, 'completed': 0, 'failed': 0}
+
+    def submit(self, *args, **kwargs):
+        """Queue a call of `func` and return its job id"""
+        if self.cache is not None:
+            key = self.cache.key_for(self.func, *args, **kwargs)
+        else:
+            key = _request_key(self.func, args, kwargs)
+
+        with self._lock:
+            self._counts['submitted'] += 1
+            if key in self._inflight:
+                self._counts['deduplicated'] += 1
+                return self._inflight[key]
+
+            job_id = uuid.uuid4().hex
+            job = {
+                'id': job_id,
+                'state': 'queued',
+                'submitted': time.time(),
+                'started': None,
+                'finished': None,
+                'result': None,
+                'error': None,
+                'future': None,
+                'event': threading.Event(),
+            }
+            self._jobs[job_id] = job
+
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                self._counts['cache_hits'] += 1
+                job.update(state='done', started=job['submitted'], finished=time.time(), result=cached)
+                job['event'].set()
+                self._trim()
+                return job_id
+
+            self._inflight[key] = job_id
+            try:
+                job['future'] = self._submit(args, kwargs)
+            except Exception as e:
+                job.update(state='failed', finished=time.time(), error=f"{type(e).__name__}: {e}")
+                self._counts['failed'] += 1
+                self._inflight.pop(key, None)
+                self._trim()
+                job['event'].set()
+                return job_id
+
+        job['future'].add_done_callback(lambda future: self._finish(job_id, key, future))
+        return job_id
+
+    def _submit(self, args, kwargs):
+        """Send a job to the pool, replacing the pool once if a worker has died (caller holds the lock)"""
+        try:
+            return self._pool.submit(_run_job, self.func, args, kwargs)
+        except BrokenProcessPool:
+            # Jobs already in the dead pool fail through _finish; new work gets a fresh pool
+            self._pool.shutdown(wait=False)
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool.submit(_run_job, self.func, args, kwargs)
+
+    def _finish(self, job_id, key, future):
+        """Record a finished job (runs on the executor's callback thread)"""
+        job = self._jobs[job_id]
+        try:
+            started, finished, result = future.result()
+        except Exception as e:
+            started, finished, result = None, time.time(), None
+            job['error'] = f"{type(e).__name__}: {e}"
+
+        if job['error'] is None and self.cache is not None:
+            # A result the cache cannot store (not JSON-serializable, database
+            # locked) is still a good result; waiters must not hang on it
+            try:
+                self.cache.put(key, result)
+            except Exception:
+                logger.exception("Could not cache result of job %s", job_id)
+
+        with self._lock:
+            job.update(started=started, finished=finished, result=result, future=None)
+            if job['error'] is None:
+                job['state'] = 'done'
+                self._counts['completed'] += 1
+                self._latencies.append((started - job['submitted'], finished - started))
+            else:
+                job['state'] = 'failed'
+                self._counts['failed'] += 1
+            self._inflight.pop(key, None)
+            self._trim()
+        job['event'].set()
+
+    def _trim(self):
+        """Forget the oldest finished jobs beyond max_finished (caller holds the lock)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job['state'] in ('done', 'failed')]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def _state(self, job):
+        # The pool pre-loads one extra call into its worker queue, so a job can
+        # report 'running' slightly before a worker actually picks it up
+        if job['state'] == 'queued' and job['future'] is not None and job['future'].running():
+            return 'running'
+        return job['state']
+
+    def status(self, job_id):
+        """Return the job's state ('queued', 'running', 'done', 'failed') and queue position"""
+        with self._lock:
+            job = self._jobs[job_id]
+            state = self._state(job)
+            ahead = 0
+            if state == 'queued':
+                ahead = sum(
+                    1 for other in self._jobs.values()
+                    if other['submitted'] < job['submitted'] and self._state(other) == 'queued'
+                )
+            return {
+                'id': job_id,
+                'state': state,
+                'queue_position': ahead,
+                'elapsed_s': (job['finished'] or time.time()) - job['submitted'],
+                'error': job['error'],
+            }
+
+    def wait(self, job_id, timeout=None):
+        """Block up to `timeout` seconds for the job; return True once it has finished"""
+        return self._jobs[job_id]['event'].wait(timeout)
+
+    def result(self, job_id, timeout=None):
+        """Return the job's result, waiting for it; raises RuntimeError if the job failed"""
+        if not self.wait(job_id, timeout):
+            raise TimeoutError(f"Job {job_id} is still {self.status(job_id)['state']}")
+        job = self._jobs[job_id]
+        if job['error'] is not None:
+            raise RuntimeError(job['error'])
+        return job['result']
+
+    def metrics(self):
+        """Queue depth, throughput counters and recent wait/run latencies"""
+        with self._lock:
+            states = [self._state(job) for job in self._jobs.values()]
+            latencies = list(self._latencies)
+            metrics = dict(self._counts)
+
+        metrics['queue_depth'] = states.count('queued')
+        metrics['running'] = states.count('running')
+        if latencies:
+            waits = sorted(wait for wait, _ in latencies)
+            totals = sorted(wait + run for wait, run in latencies)
+            metrics['wait_s_mean'] = sum(waits) / len(waits)
+            metrics['run_s_mean'] = sum(run for _, run in latencies) / len(latencies)
+            metrics['latency_s_p50'] = totals[len(totals) // 2]
+            metrics['latency_s_p95'] = totals[min(len(totals) - 1, int(len(totals) * 0.95))]
+        return metrics
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes"""
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,221 @@
+"""
+Typed columnar store for the propeller database
+Parses data/propeller_database.csv once into NumPy/pandas columns, or
+memory-maps a binary copy of it written by `convert_to_binary`
+
+Convert the CSV after editing it:
+    python src/propeller_store.py data/propeller_database.csv
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Column types for propeller_database.csv
+FLOAT_COLUMNS = [
+    'speed_knots', 'displacement_tons', 'draft_m', 'beam_m', 'power_kw',
+    'diameter_m', 'pitch_ratio', 'kt', 'kq', 'efficiency'
+]
+INT_COLUMNS = ['rpm', 'blade_count']
+CATEGORY_COLUMNS = ['vessel_type', 'material', 'propeller_type']
+
+# Binary layout: magic, header length (uint64), JSON header, then one
+# fixed-width array per column, each starting on an ALIGNMENT boundary.
+# CATEGORY_COLUMNS are stored as int32 codes plus a dictionary block of
+# NUL-separated UTF-8 values; other text columns as int64 end offsets plus
+# a block of concatenated UTF-8 values. Empty text is a missing value, as
+# read_csv never yields an empty string.
+BINARY_MAGIC = b'PROPDB01'
+BINARY_SUFFIX = '.bin'
+ALIGNMENT = 64
+
+
+def display_name(vessel_type):
+    """Format a vessel_type key for display (patrol_boat -> Patrol Boat)"""
+    return vessel_type.replace('_', ' ').title()
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _read_csv_table(path):
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {col: 'float64' for col in FLOAT_COLUMNS if col in header}
+    dtypes.update({col: 'int64' for col in INT_COLUMNS if col in header})
+    dtypes.update({col: 'category' for col in CATEGORY_COLUMNS if col in header})
+    return pd.read_csv(path, dtype=dtypes, encoding='utf-8')
+
+
+def _source_stamp(path):
+    """Size and modification time of the CSV a binary file was converted from"""
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def binary_path_for(csv_path):
+    """Default location of the binary copy (data/propeller_database.bin)"""
+    return Path(csv_path).with_suffix(BINARY_SUFFIX)
+
+
+def convert_to_binary(csv_path='data/propeller_database.csv', binary_path=None):
+    """
+    Write the CSV database to the columnar binary format and return its path
+
+    Numeric columns are written as little-endian float64/int64 arrays,
+    CATEGORY_COLUMNS are dictionary-encoded and other text columns (notes)
+    are stored as plain strings. The CSV's size and modification time are
+    recorded so stale binaries are detected and ignored.
+    """
+    csv_path = Path(csv_path)
+    binary_path = Path(binary_path) if binary_path else binary_path_for(csv_path)
+    table = _read_csv_table(csv_path)
+
+    columns, blocks, offset = [], [], 0
+    for name in table.columns:
+        series = table[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            kind = 'dictionary'
+            data = series.cat.codes.to_numpy().astype('<i4')
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            kind = 'numeric'
+            data = series.to_numpy().astype(series.dtype.newbyteorder('<'))
+        else:
+            kind = 'string'
+            values = [value.encode('utf-8') if isinstance(value, str) else b'' for value in series]
+            data = np.cumsum([len(value) for value in values], dtype='<i8')
+
+        column = {'name': name, 'kind': kind, 'dtype': data.dtype.str, 'offset': offset}
+        blocks.append((offset, data.tobytes()))
+        offset = _align(offset + data.nbytes)
+
+        if kind == 'dictionary':
+            dictionary = '\0'.join(str(value) for value in series.cat.categories).encode('utf-8')
+            column.update(dictionary_offset=offset, dictionary_size=len(dictionary),
+                          dictionary_count=len(series.cat.categories))
+            blocks.append((offset, dictionary))
+            offset = _align(offset + len(dictionary))
+        elif kind == 'string':
+            text = b''.join(values)
+            column.update(text_offset=offset, text_size=len(text))
+            blocks.append((offset, text))
+            offset = _align(offset + len(text))
+        columns.append(column)
+
+    header = json.dumps({
+        'version': 2,
+        'rows': len(table),
+        'columns': columns,
+        'source': _source_stamp(csv_path),
+    }).encode('utf-8')
+    data_start = _align(len(BINARY_MAGIC) + 8 + len(header))
+
+    tmp_path = binary_path.with_name(binary_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(BINARY_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for offset, data in blocks:
+            f.seek(data_start + offset)
+            f.write(data)
+    os.replace(tmp_path, binary_path)
+    return binary_path
+
+
+def _read_binary_header(buffer):
+    if bytes(buffer[:len(BINARY_MAGIC)]) != BINARY_MAGIC:
+        raise ValueError("Not a propeller database binary file")
+    start = len(BINARY_MAGIC)
+    (length,) = struct.unpack('<Q', bytes(buffer[start:start + 8]))
+    header = json.loads(bytes(buffer[start + 8:start + 8 + length]))
+    return header, _align(start + 8 + length)
+
+
+def open_propeller_binary(path):
+    """
+    Memory-map a binary database written by `convert_to_binary`
+
+    Numeric columns and dictionary codes are read-only views of the mapped
+    file, so the OS page cache holds one copy shared by every process that
+    opens it. Dictionary columns come back as categoricals and string columns
+    are decoded into the same dtype the CSV path gives them.
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    header, data_start = _read_binary_header(buffer)
+    rows = header['rows']
+
+    columns = {}
+    for column in header['columns']:
+        data = np.frombuffer(buffer, dtype=column['dtype'], count=rows,
+                             offset=data_start + column['offset'])
+        if column['kind'] == 'dictionary':
+            start = data_start + column['dictionary_offset']
+            text = bytes(buffer[start:start + column['dictionary_size']]).decode('utf-8')
+            categories = text.split('\0') if column['dictionary_count'] else []
+            data = pd.Categorical.from_codes(data, categories=categories)
+        elif column['kind'] == 'string':
+            start = data_start + column['text_offset']
+            text = bytes(buffer[start:start + column['text_size']])
+            starts = np.concatenate([[0], data[:-1]])
+            data = np.array([text[a:b].decode('utf-8') if b > a else np.nan for a, b in zip(starts, data)],
+                            dtype=object)
+        columns[column['name']] = data
+    return pd.DataFrame(columns, copy=False)
+
+
+def binary_is_current(binary_path, csv_path):
+    """True if the binary file exists and was converted from the CSV as it is now"""
+    binary_path, csv_path = Path(binary_path), Path(csv_path)
+    if not binary_path.exists():
+        return False
+    if not csv_path.exists():
+        return True
+    try:
+        header, _ = _read_binary_header(np.memmap(binary_path, dtype=np.uint8, mode='r'))
+    except ValueError:
+        return False
+    return header.get('source') == _source_stamp(csv_path)
+
+
+def load_propeller_table(path='data/propeller_database.csv', prefer_binary=True):
+    """
+    Load the propeller database as a typed DataFrame
+
+    Numeric columns are parsed once into float64/int64 arrays, repeated labels
+    (vessel_type, material, propeller_type) become categoricals, and a
+    `display_name` column holds the formatted vessel type. When a binary copy
+    next to the CSV is up to date it is memory-mapped instead of parsing the
+    text. Returns an empty DataFrame when neither file exists.
+    """
+    path = Path(path)
+    binary_path = binary_path_for(path)
+    if prefer_binary and binary_is_current(binary_path, path):
+        table = open_propeller_binary(binary_path)
+    elif path.exists():
+        table = _read_csv_table(path)
+    else:
+        return pd.DataFrame()
+
+    # Format each distinct vessel type once instead of once per row
+    table['display_name'] = table['vessel_type'].map(display_name)
+    return table
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert the propeller database CSV to the binary format")
+    parser.add_argument('csv', nargs='?', default='data/propeller_database.csv')
+    parser.add_argument('-o', '--output', default=None, help="Binary file (default: next to the CSV, .bin)")
+    args = parser.parse_args()
+
+    output = convert_to_binary(args.csv, args.output)
+    print(f"Wrote {output} ({output.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""
+Streaming design reports for the Propeller Optimizer
+Renders designs as TXT, CSV or JSON Lines one vessel at a time, so fleet
+runs of any size can be written to a file or streamed as an HTTP response
+with flat memory use
+
+A design is a (spec, row) pair: the vessel spec (V_knots, displacement_t,
+draft_m, power_kw, rpm) and an output row in the optimization_result.csv
+schema (RESULT_FIELDS), as produced by batch_cli.run_batch.
+"""
+
+import csv
+import io
+import json
+import math
+
+from figures import INITIAL_ETA
+
+# Output columns, same schema as optimization_result.csv
+RESULT_FIELDS = [
+    'diameter_m', 'diameter_inches', 'pitch_ratio', 'kt', 'kq', 'efficiency',
+    'blade_count', 'material', 'recommended_material', 'propeller_type',
+    'cavitation_risk', 'similar_vessel', 'match_quality', 'source', 'notes'
+]
+
+# Per-vessel TXT layout (the Streamlit app's report)
+TXT_TEMPLATE = """
+MARINE PROPELLER DESIGN REPORT
+Generated by Propeller Optimizer
+================================
+
+VESSEL SPECIFICATIONS
+---------------------
+Speed:              {V_knots} knots
+Displacement:       {displacement_t} tons
+Draft:              {draft_m} m
+Engine Power:       {power_kw} kW
+Propeller RPM:      {rpm}
+
+OPTIMIZED PROPELLER DESIGN
+--------------------------
+Diameter (D):       {diameter_m:.3f} m ({diameter_inches:.2f} inches)
+Pitch Ratio (P/D):  {pitch_ratio:.3f}
+Thrust Coeff (KT):  {kt:.4f}
+Torque Coeff (KQ):  {kq:.4f}
+Efficiency (η):     {efficiency:.4f} ({efficiency_pct:.1f}%)
+{details}
+PERFORMANCE
+-----------
+Efficiency Gain:    {efficiency_gain:+.0f}% vs initial estimate
+Status:             {status}
+
+DISCLAIMER
+----------
+This is a preliminary design tool. Always consult with
+professional marine engineers before manufacturing.
+
+Generated: {generated}
+"""
+
+ERROR_TEMPLATE = """
+MARINE PROPELLER DESIGN REPORT
+Generated by Propeller Optimizer
+================================
+
+VESSEL SPECIFICATIONS
+---------------------
+Speed:              {V_knots} knots
+Displacement:       {displacement_t} tons
+Draft:              {draft_m} m
+Engine Power:       {power_kw} kW
+Propeller RPM:      {rpm}
+
+Status:             ❌ FAILED ({notes})
+
+Generated: {generated}
+"""
+
+# Optional row fields listed under the design when present
+DETAIL_LABELS = [
+    ('blade_count', 'Blade Count'),
+    ('material', 'Material'),
+    ('propeller_type', 'Propeller Type'),
+    ('cavitation_risk', 'Cavitation Risk'),
+    ('similar_vessel', 'Matched Vessel'),
+    ('match_quality', 'Match Quality'),
+    ('notes', 'Notes'),
+]
+
+SPEC_FIELDS = ['V_knots', 'displacement_t', 'draft_m', 'power_kw', 'rpm']
+
+
+def optimizer_row(result):
+    """Map a run_optimization result dict onto the RESULT_FIELDS schema"""
+    row = dict.fromkeys(RESULT_FIELDS, '')
+    row.update({
+        'diameter_m': result['D'],
+        'diameter_inches': result['D'] * 39.37,
+        'pitch_ratio': result['P_D'],
+        'kt': result['KT'],
+        'kq': result['KQ'],
+        'efficiency': result['eta'],
+        'source': 'Optimizer',
+    })
+    return row
+
+
+def render_txt(spec, row, generated=''):
+    """Render one design with the per-vessel TXT layout"""
+    values = {name: spec.get(name, '') for name in SPEC_FIELDS}
+    values['generated'] = generated
+
+    if row.get('source') == 'Error':
+        return ERROR_TEMPLATE.format(notes=row.get('notes', ''), **values)
+
+    design = {name: float(row[name]) for name in ('diameter_m', 'pitch_ratio', 'kt', 'kq', 'efficiency')}
+    details = ''.join(f"{label + ':':<20}{row[name]}\n" for name, label in DETAIL_LABELS if row.get(name, '') != '')
+    return TXT_TEMPLATE.format(
+        diameter_inches=design['diameter_m'] * 39.37,
+        efficiency_pct=design['efficiency'] * 100,
+        efficiency_gain=(design['efficiency'] / INITIAL_ETA - 1) * 100,
+        details=details,
+        status='✅ OPTIMIZED' if row.get('source') == 'Optimizer' else f"✅ {row.get('source', '')}",
+        **design, **values,
+    )
+
+
+def iter_txt(designs, generated=''):
+    """Yield the TXT report one vessel at a time"""
+    for spec, row in designs:
+        yield render_txt(spec, row, generated)
+
+
+def iter_csv(designs, fields=None):
+    """
+    Yield the CSV report line by line, header first
+
+    Columns default to RESULT_FIELDS; spec fields or `input_row` can be
+    included by naming them in `fields`.
+    """
+    fields = fields or RESULT_FIELDS
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+
+    def flush():
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    writer.writeheader()
+    yield flush()
+    for spec, row in designs:
+        writer.writerow({**spec, **row})
+        yield flush()
+
+
+def _json_value(value):
+    """NumPy scalars as Python numbers and NaN or infinity as null, so every line is valid JSON"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def iter_jsonl(designs):
+    """Yield one JSON object per design: the spec fields followed by the output row"""
+    for spec, row in designs:
+        record = {name: spec[name] for name in SPEC_FIELDS if name in spec}
+        record.update(row)
+        record = {name: _json_value(value) for name, value in record.items()}
+        yield json.dumps(record, default=str, allow_nan=False) + '\n'
+
+
+FORMATS = {'txt': iter_txt, 'csv': iter_csv, 'jsonl': iter_jsonl}
+
+
+def write_report(designs, stream, fmt='csv', flush=False, **options):
+    """
+    Write designs to an open text stream as they arrive; returns the count
+
+    `options` go to the format's generator (e.g. fields= for CSV). With
+    flush=True the stream is flushed after every vessel, for pipes.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown report format: {fmt} (use one of {', '.join(FORMATS)})")
+
+    count = 0
+
+    def counted():
+        nonlocal count
+        for design in designs:
+            count += 1
+            yield design
+
+    for chunk in FORMATS[fmt](counted(), **options):
+        stream.write(chunk)
+        if flush:
+            stream.flush()
+    return count
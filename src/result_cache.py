@@ -0,0 +1,160 @@
+"""
+Persistent result cache for the Propeller Optimizer
+Stores run_optimization, predict_speed and size_diameter results in SQLite
+so repeat designs come back instantly across sessions and processes
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import numbers
+import os
+import sqlite3
+import time
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'propeller-optimizer', 'results.sqlite')
+
+# Engineering tolerance for each input; values closer than this share a cache entry
+DEFAULT_TOLERANCES = {
+    'V_knots': 0.1,
+    'displacement_t': 0.01,
+    'draft_m': 0.005,
+    'power_kw': 1.0,
+    'rpm': 1.0,
+    'beam_m': 0.01,
+    'loa_m': 0.05,
+}
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def _to_json(value):
+    """JSON fallback for NumPy scalars and arrays in results"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+@functools.lru_cache(maxsize=None)
+def solver_version(func):
+    """Hash of the source file defining `func`, so solver edits invalidate old entries"""
+    try:
+        with open(inspect.getsourcefile(func), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except (OSError, TypeError):
+        return 'unknown'
+
+
+class ResultCache:
+    """
+    Content-addressed SQLite cache with LRU eviction
+
+    Keys are built from the function name, a solver version hash and the input
+    dict quantized to `tolerances`. Once more than `max_entries` results are
+    stored, the least recently used ones are evicted.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, tolerances=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.tolerances = dict(DEFAULT_TOLERANCES if tolerances is None else tolerances)
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # One short-lived connection per call keeps the cache safe to share
+        # between Streamlit script threads and worker processes
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def quantize(self, params):
+        """Round each named input to its tolerance (as an integer step count)"""
+        quantized = {}
+        for name, value in params.items():
+            tolerance = self.tolerances.get(name)
+            if isinstance(value, dict):
+                quantized[name] = self.quantize(value)
+            elif tolerance and isinstance(value, numbers.Real):
+                quantized[name] = round(value / tolerance)
+            else:
+                quantized[name] = value
+        return quantized
+
+    def key(self, name, params, version=''):
+        """Cache key for calling `name` with `params` under solver `version`"""
+        payload = json.dumps([name, version, self.quantize(params)], sort_keys=True, default=_to_json)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def key_for(self, func, *args, **kwargs):
+        """Cache key for calling solver function `func` with these arguments"""
+        name = f"{func.__module__}.{func.__qualname__}"
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        return self.key(name, bound.arguments, solver_version(func))
+
+    def get(self, key):
+        """Return the cached result for `key`, or None on a miss"""
+        with self._connect() as conn:
+            row = conn.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key, result):
+        """Store `result` under `key`, evicting least recently used entries over the cap"""
+        value = json.dumps(result, default=_to_json)
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)',
+                (key, value, time.time())
+            )
+            conn.execute(
+                'DELETE FROM results WHERE key IN '
+                '(SELECT key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def clear(self):
+        """Remove every cached result"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM results')
+
+    def cached(self, func):
+        """
+        Wrap a solver function so its results are cached
+
+        Works for functions taking a params dict (run_optimization) as well as
+        keyword inputs; arguments are matched to the tolerance table by name.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = self.key_for(func, *args, **kwargs)
+            result = self.get(key)
+            if result is None:
+                result = func(*args, **kwargs)
+                self.put(key, result)
+            return result
+
+        wrapper.cache = self
+        return wrapper
@@ -0,0 +1,150 @@
+"""
+Vectorized Savitsky planing-hull resistance
+Evaluates the Savitsky (1964) prismatic planing-hull method over arrays of
+speeds and hulls at once, solving trim equilibrium array-wise
+
+All inputs broadcast against each other, so a power-speed curve is
+    resistance(np.linspace(20, 60, 200), 9.72, 2.96, loa_m=13.5)
+and a curve per hull is
+    resistance(speeds[None, :], displacements[:, None], beams[:, None], loa_m=loas[:, None])
+"""
+
+import numpy as np
+
+RHO = 1025.0          # sea water density, kg/m^3
+NU = 1.19e-6          # sea water kinematic viscosity at 15 C, m^2/s
+G = 9.81
+KNOT = 0.514444       # m/s per knot
+
+DEFAULT_DEADRISE_DEG = 15.0
+# LCG from the transom as a fraction of LOA, used when no LCG is given
+DEFAULT_LCG_FRACTION = 0.35
+# ITTC roughness allowance added to the friction coefficient
+ROUGHNESS_ALLOWANCE = 0.0004
+
+# Range of the data Savitsky's equations were fitted to
+VALID_TRIM_DEG = (2.0, 15.0)
+VALID_CV = (0.6, 13.0)
+VALID_LAMBDA_MAX = 4.0
+
+
+def _bisect(func, lo, hi, iterations=40):
+    """
+    Array-wise bisection for an increasing `func`
+
+    Every element of `lo`/`hi` brackets its own root; all elements are
+    halved together, so the cost is `iterations` vectorized evaluations
+    regardless of how many points are solved.
+    """
+    lo, hi = np.array(lo, dtype=float), np.array(hi, dtype=float)
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        below = func(mid) < 0
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return 0.5 * (lo + hi)
+
+
+def friction_coefficient(reynolds):
+    """ITTC-1957 friction line plus roughness allowance"""
+    return 0.075 / (np.log10(reynolds) - 2.0) ** 2 + ROUGHNESS_ALLOWANCE
+
+
+def resistance(speed_knots, displacement_t, beam_m, loa_m=None, lcg_m=None,
+               deadrise_deg=DEFAULT_DEADRISE_DEG):
+    """
+    Savitsky calm-water resistance of a prismatic planing hull
+
+    `lcg_m` is measured forward of the transom and defaults to
+    DEFAULT_LCG_FRACTION * loa_m. Thrust and friction drag are taken to act
+    through the centre of gravity, so trim equilibrium reduces to the centre
+    of pressure lying at the LCG. Returns a dict of arrays with the
+    broadcast shape of the inputs; `valid` is False where the point is
+    outside the range of Savitsky's data or the wetted length exceeds LOA.
+    """
+    if lcg_m is None:
+        if loa_m is None:
+            raise ValueError("Give lcg_m or loa_m (LCG defaults to a fraction of LOA)")
+        lcg_m = DEFAULT_LCG_FRACTION * np.asarray(loa_m, dtype=float)
+
+    V, displacement, beam, lcg, beta = np.broadcast_arrays(
+        np.asarray(speed_knots, dtype=float) * KNOT,
+        np.asarray(displacement_t, dtype=float) * 1000.0 * G,
+        np.asarray(beam_m, dtype=float),
+        np.asarray(lcg_m, dtype=float),
+        np.asarray(deadrise_deg, dtype=float),
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = V / np.sqrt(G * beam)
+        cl_beta = displacement / (0.5 * RHO * V ** 2 * beam ** 2)
+
+        # Deadrise lift: C_Lbeta = C_L0 - 0.0065 beta C_L0^0.6, solved for C_L0
+        k = 0.0065 * beta
+        cl_0 = _bisect(lambda x: x - k * x ** 0.6 - cl_beta, cl_beta, cl_beta + k + 1.0)
+
+        # Moment balance: centre of pressure lp = lambda b (0.75 - 1 / (5.21 Cv^2 / lambda^2 + 2.39)) at the LCG
+        def centre_of_pressure_error(lam):
+            return lam * beam * (0.75 - 1.0 / (5.21 * cv ** 2 / lam ** 2 + 2.39)) - lcg
+
+        lam = _bisect(centre_of_pressure_error, np.full(V.shape, 1e-3), np.full(V.shape, 50.0))
+
+        # Flat-plate lift: C_L0 = tau^1.1 (0.012 lambda^0.5 + 0.0055 lambda^2.5 / Cv^2), tau in degrees
+        trim_deg = (cl_0 / (0.012 * lam ** 0.5 + 0.0055 * lam ** 2.5 / cv ** 2)) ** (1 / 1.1)
+        trim = np.radians(trim_deg)
+
+        # Mean velocity over the bottom is reduced by the pressure lift
+        mean_velocity = V * np.sqrt(1.0 - 0.0120 * trim_deg ** 1.1 / (lam ** 0.5 * np.cos(trim)))
+        wetted_length = lam * beam
+        reynolds = mean_velocity * wetted_length / NU
+        friction = (0.5 * RHO * mean_velocity ** 2 * lam * beam ** 2
+                    * friction_coefficient(reynolds) / np.cos(np.radians(beta)))
+
+        total = displacement * np.tan(trim) + friction / np.cos(trim)
+
+    valid = (
+        (trim_deg >= VALID_TRIM_DEG[0]) & (trim_deg <= VALID_TRIM_DEG[1])
+        & (cv >= VALID_CV[0]) & (cv <= VALID_CV[1])
+        & (lam <= VALID_LAMBDA_MAX)
+    )
+    if loa_m is not None:
+        valid &= wetted_length <= np.asarray(loa_m, dtype=float)
+
+    return {
+        'speed_knots': V / KNOT,
+        'resistance_kn': total / 1000.0,
+        'friction_kn': friction / 1000.0,
+        'effective_power_kw': total * V / 1000.0,
+        'trim_deg': trim_deg,
+        'wetted_length_m': wetted_length,
+        'lambda': lam,
+        'cv': cv,
+        'valid': valid,
+    }
+
+
+def predict_speed(power_kw, displacement_t, beam_m, loa_m=None, lcg_m=None,
+                  deadrise_deg=DEFAULT_DEADRISE_DEG, propulsive_efficiency=0.55,
+                  speed_range=(5.0, 80.0)):
+    """
+    Speed at which effective power equals power_kw * propulsive_efficiency
+
+    Solved for all inputs at once by array-wise bisection over `speed_range`
+    (knots); assumes effective power rises with speed over that range, which
+    holds once the hull is planing. Returns the speeds in knots.
+    """
+    available_kw = np.asarray(power_kw, dtype=float) * propulsive_efficiency
+    shape = np.broadcast_shapes(np.shape(available_kw), np.shape(displacement_t), np.shape(beam_m),
+                                np.shape(loa_m), np.shape(lcg_m), np.shape(deadrise_deg))
+
+    def power_error(speed):
+        curve = resistance(speed, displacement_t, beam_m, loa_m, lcg_m, deadrise_deg)
+        return curve['effective_power_kw'] - available_kw
+
+    return _bisect(power_error, np.full(shape, speed_range[0]), np.full(shape, speed_range[1]), iterations=30)
+
+
+def propeller_thrust_kn(kt, rpm, diameter_m, rho=RHO):
+    """Open-water thrust T = KT rho n^2 D^4 in kN, for thrust/resistance checks"""
+    n = np.asarray(rpm, dtype=float) / 60.0
+    return np.asarray(kt, dtype=float) * rho * n ** 2 * np.asarray(diameter_m, dtype=float) ** 4 / 1000.0
@@ -0,0 +1,279 @@
+"""
+HTTP/JSON service for the Propeller Optimizer
+A dependency-free ASGI app exposing run_optimization, size_diameter, the
+Savitsky speed prediction and the CSV nearest-vessel match to other tools
+
+Run with any ASGI server, e.g.:
+    uvicorn service:app --app-dir src --port 8000
+
+Endpoints (POST bodies are one JSON object or a list of objects):
+    POST /optimize        vessel specs -> run_optimization results
+    POST /size-diameter   vessel specs -> {"diameter_m"} from size_diameter
+    POST /predict-speed   {"power_kw", "displacement_t", "beam_m", "loa_m"} -> {"V_knots"}
+    POST /match           {"speed", "displacement", "draft", "k"} -> nearest database vessels
+    GET  /health          liveness check
+    GET  /metrics         request counters and latency
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Per-process state for pool workers, filled in by _init_worker
+_worker = {}
+
+
+def _init_worker(database_path):
+    """Warm a worker: import the solver and load the vessel database and index once"""
+    from propeller_store import load_propeller_table
+    from vessel_index import VesselIndex
+
+    # Endpoints whose backing module is unavailable answer with an error item
+    # instead of taking the whole worker down
+    try:
+        import optimizer
+    except ImportError:
+        optimizer = None
+    _worker['run_optimization'] = getattr(optimizer, 'run_optimization', None)
+    _worker['size_diameter'] = getattr(optimizer, 'size_diameter', None)
+
+    table = load_propeller_table(database_path)
+    _worker['table'] = table
+    _worker['index'] = VesselIndex.from_table(table) if not table.empty else None
+
+
+def _match(request):
+    """Nearest database vessels for one match request"""
+    from vessel_index import match_quality
+
+    if _worker['index'] is None:
+        raise RuntimeError("Propeller database is not available")
+
+    distances, positions = _worker['index'].nearest(
+        float(request['speed']), float(request['displacement']), float(request['draft']),
+        k=int(request.get('k', 1))
+    )
+    table = _worker['table']
+    matches = []
+    for distance, position in zip(distances, positions):
+        row = table.iloc[position]
+        matches.append({
+            'vessel_type': row['vessel_type'],
+            'distance': float(distance),
+            'match_quality': match_quality(distance),
+            'diameter_m': float(row['diameter_m']),
+            'pitch_ratio': float(row['pitch_ratio']),
+            'kt': float(row['kt']),
+            'kq': float(row['kq']),
+            'efficiency': float(row['efficiency']),
+            'blade_count': int(row['blade_count']),
+            'material': row['material'],
+        })
+    return matches
+
+
+def _optimize(request):
+    """run_optimization for one vessel spec"""
+    if _worker['run_optimization'] is None:
+        raise RuntimeError("The optimizer is not available on this server")
+    return _worker['run_optimization'](request)
+
+
+def _size_diameter(request):
+    """size_diameter for one vessel spec, called with the same spec dict as run_optimization"""
+    if _worker['size_diameter'] is None:
+        raise RuntimeError("The optimizer is not available on this server")
+    return {'diameter_m': float(_worker['size_diameter'](request))}
+
+
+def _predict_speed(request):
+    """Savitsky speed at which the hull absorbs the delivered power"""
+    from savitsky import predict_speed
+
+    speed = predict_speed(
+        float(request['power_kw']), float(request['displacement_t']), float(request['beam_m']),
+        loa_m=float(request['loa_m']) if 'loa_m' in request else None,
+        lcg_m=float(request['lcg_m']) if 'lcg_m' in request else None,
+        **{name: float(request[name]) for name in ('deadrise_deg', 'propulsive_efficiency') if name in request}
+    )
+    return {'V_knots': float(speed)}
+
+
+HANDLERS = {
+    'optimize': _optimize,
+    'size-diameter': _size_diameter,
+    'predict-speed': _predict_speed,
+    'match': _match,
+}
+
+
+def _run_batch(endpoint, requests):
+    """Worker entry point: evaluate a batch of requests, one result or error per item"""
+    results = []
+    for request in requests:
+        try:
+            results.append(HANDLERS[endpoint](request))
+        except Exception as e:
+            results.append({'error': f"{type(e).__name__}: {e}"})
+    return results
+
+
+def _to_json(value):
+    """JSON fallback for NumPy scalars and arrays in results"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class OptimizerService:
+    """
+    ASGI application
+
+    CPU-bound work runs in a process pool so the event loop only parses and
+    routes requests. Each list body is split into chunks of `chunk_size`
+    items spread over the workers.
+    """
+
+    ENDPOINTS = tuple(HANDLERS)
+
+    def __init__(self, workers=None, database_path='data/propeller_database.csv', chunk_size=32):
+        self.workers = workers or os.cpu_count() or 1
+        self.database_path = database_path
+        self.chunk_size = chunk_size
+        self.pool = None
+        self.started = time.time()
+        self.stats = {'requests': 0, 'items': 0, 'errors': 0, 'busy_s': 0.0}
+
+    def start(self):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(self.database_path,))
+            # Spin workers up (running the initializer) before the first request arrives
+            for future in [self.pool.submit(_run_batch, 'match', []) for _ in range(self.workers)]:
+                future.result()
+
+    def stop(self, wait=True):
+        if self.pool is not None:
+            self.pool.shutdown(wait=wait)
+            self.pool = None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            status, payload = await self._handle(scope, receive)
+            body = json.dumps(payload, default=_to_json).encode('utf-8')
+            await send({
+                'type': 'http.response.start',
+                'status': status,
+                'headers': [(b'content-type', b'application/json'),
+                            (b'content-length', str(len(body)).encode('ascii'))],
+            })
+            await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self.start)
+                except BrokenProcessPool:
+                    # Retried on the first request, which then reports the failure as a 503
+                    self.stop(wait=False)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _read_body(self, receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    async def _handle(self, scope, receive):
+        method, endpoint = scope['method'], scope['path'].strip('/')
+
+        if endpoint == 'health':
+            return 200, {'status': 'ok'}
+        if endpoint == 'metrics':
+            requests = self.stats['requests']
+            return 200, dict(self.stats, workers=self.workers, uptime_s=time.time() - self.started,
+                             latency_s_mean=self.stats['busy_s'] / requests if requests else 0.0)
+        if endpoint not in self.ENDPOINTS:
+            return 404, {'error': f"Unknown endpoint: {scope['path']}"}
+        if method != 'POST':
+            return 405, {'error': "Use POST with a JSON body"}
+
+        body = await self._read_body(receive)
+        if body is None:
+            return 413, {'error': f"Request body exceeds {MAX_BODY_BYTES} bytes"}
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            return 400, {'error': f"Invalid JSON: {e}"}
+
+        batched = isinstance(payload, list)
+        requests = payload if batched else [payload]
+        if not all(isinstance(request, dict) for request in requests):
+            return 400, {'error': "Body must be a JSON object or a list of objects"}
+
+        started = time.perf_counter()
+        try:
+            if self.pool is None:
+                await asyncio.get_running_loop().run_in_executor(None, self.start)
+            results = await self._evaluate(endpoint, requests)
+        except BrokenProcessPool:
+            # A worker died (or failed to start); drop the pool so the next request builds a new one
+            self.stop(wait=False)
+            self.stats['errors'] += len(requests)
+            return 503, {'error': "Worker pool failed; it is being restarted, please retry"}
+        self.stats['busy_s'] += time.perf_counter() - started
+        self.stats['requests'] += 1
+        self.stats['items'] += len(requests)
+        failed = sum(1 for result in results if isinstance(result, dict) and 'error' in result)
+        self.stats['errors'] += failed
+
+        if batched:
+            return 200, results
+        return (422 if failed else 200), results[0]
+
+    async def _evaluate(self, endpoint, requests):
+        """Fan a batch out over the pool in chunks and gather results in order"""
+        loop = asyncio.get_running_loop()
+        chunks = [requests[i:i + self.chunk_size] for i in range(0, len(requests), self.chunk_size)]
+        done = await asyncio.gather(*[
+            loop.run_in_executor(self.pool, _run_batch, endpoint, chunk) for chunk in chunks
+        ])
+        return [result for chunk in done for result in chunk]
+
+
+app = OptimizerService()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the Propeller Optimizer HTTP service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None, help="Solver processes (default: CPU count)")
+    parser.add_argument('--database', default='data/propeller_database.csv')
+    args = parser.parse_args()
+
+    uvicorn.run(OptimizerService(workers=args.workers, database_path=args.database),
+                host=args.host, port=args.port)
@@ -0,0 +1,88 @@
+"""
+Interval index for data/speed_ranges.csv
+Parses the speed-category bounds once, checks them for overlaps and gaps,
+and looks speeds up by bisection (one at a time or as a NumPy array)
+"""
+
+import bisect
+import csv
+import os
+import warnings
+
+import numpy as np
+
+
+class SpeedRangeIndex:
+    """
+    Sorted, non-overlapping speed categories
+
+    `rows` are speed_ranges.csv rows (dicts with at least min_speed and
+    max_speed); they are kept as read so callers can display their fields.
+    Bounds are inclusive and neighbouring categories may share an endpoint,
+    which then belongs to the lower category. Overlapping ranges raise
+    ValueError; gaps between ranges are allowed but reported in `gaps` and
+    with a warning, and speeds inside them have no category.
+    """
+
+    def __init__(self, rows):
+        rows = sorted(rows, key=lambda row: float(row['min_speed']))
+        self.rows = rows
+        self.min_speeds = [float(row['min_speed']) for row in rows]
+        self.max_speeds = [float(row['max_speed']) for row in rows]
+        self.gaps = []
+
+        for row, low, high in zip(rows, self.min_speeds, self.max_speeds):
+            if low > high:
+                raise ValueError(f"Speed range {row.get('speed_category', '?')} has min_speed > max_speed")
+
+        for i in range(1, len(rows)):
+            previous_max, low = self.max_speeds[i - 1], self.min_speeds[i]
+            if low < previous_max:
+                raise ValueError(
+                    f"Speed ranges {rows[i - 1].get('speed_category', '?')} and "
+                    f"{rows[i].get('speed_category', '?')} overlap ({low:g} < {previous_max:g} knots)"
+                )
+            if low > previous_max:
+                self.gaps.append((previous_max, low))
+
+        if self.gaps:
+            gaps = ', '.join(f"{low:g}-{high:g}" for low, high in self.gaps)
+            warnings.warn(f"Speed ranges leave gaps with no category: {gaps} knots", stacklevel=2)
+
+        self._min_array = np.array(self.min_speeds)
+        self._max_array = np.array(self.max_speeds)
+
+    @classmethod
+    def from_csv(cls, path='data/speed_ranges.csv'):
+        """Load speed_ranges.csv; a missing file gives an empty index"""
+        if not os.path.exists(path):
+            return cls([])
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(list(csv.DictReader(f)))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def position(self, speed):
+        """Index into `rows` of the category covering `speed`, or -1"""
+        i = bisect.bisect_left(self.max_speeds, speed)
+        if i < len(self.rows) and self.min_speeds[i] <= speed:
+            return i
+        return -1
+
+    def lookup(self, speed):
+        """Return the speed_ranges row covering `speed`, or None"""
+        i = self.position(speed)
+        return self.rows[i] if i >= 0 else None
+
+    def positions(self, speeds):
+        """Vectorized position(): an int array with -1 where no category applies"""
+        speeds = np.atleast_1d(np.asarray(speeds, dtype=float))
+        found = np.searchsorted(self._max_array, speeds, side='left')
+        inside = found < len(self.rows)
+        inside[inside] = self._min_array[found[inside]] <= speeds[inside]
+        return np.where(inside, found, -1)
+
+    def lookup_many(self, speeds):
+        """Rows covering each of `speeds` (None where no category applies)"""
+        return [self.rows[i] if i >= 0 else None for i in self.positions(speeds)]
@@ -0,0 +1,222 @@
+"""
+Design-space sweep engine for the Propeller Optimizer
+Evaluates run_optimization over full-factorial or Latin-hypercube samples
+in parallel, writing a chunked, resumable .npz dataset
+
+Example:
+    python src/sweep.py sweeps/patrol --method lhs --samples 1000000 --V_knots 40 65 --workers 16
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from batch import INPUT_COLUMNS, RESULT_COLUMNS
+
+# Solver evaluated on every sample. None means optimizer.run_optimization,
+# imported in the workers so this module loads without the optimizer.
+run_optimization = None
+
+# Default sweep ranges, matching the input limits of the Streamlit app
+DEFAULT_RANGES = {
+    'V_knots': (10.0, 80.0),
+    'displacement_t': (1.0, 100.0),
+    'draft_m': (0.3, 3.0),
+    'power_kw': (100.0, 5000.0),
+    'rpm': (500.0, 4000.0),
+}
+
+MANIFEST_FILE = 'manifest.json'
+
+
+def grid_samples(ranges, points):
+    """Full-factorial samples with `points` evenly spaced values per input"""
+    axes = [np.linspace(*ranges[name], points) for name in INPUT_COLUMNS]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    return np.column_stack([axis.ravel() for axis in mesh])
+
+
+def latin_hypercube_samples(ranges, n, seed=0):
+    """Latin-hypercube samples: each input's range is split into n strata, one sample per stratum"""
+    rng = np.random.default_rng(seed)
+    unit = np.empty((n, len(INPUT_COLUMNS)))
+    for j in range(len(INPUT_COLUMNS)):
+        unit[:, j] = (rng.permutation(n) + rng.random(n)) / n
+
+    low = np.array([ranges[name][0] for name in INPUT_COLUMNS])
+    high = np.array([ranges[name][1] for name in INPUT_COLUMNS])
+    return low + unit * (high - low)
+
+
+def _chunk_path(out_dir, chunk_id):
+    return os.path.join(out_dir, f"chunk_{chunk_id:06d}.npz")
+
+
+def _chunk_errors(data):
+    """Per-sample error messages of a loaded chunk, '' for samples that succeeded"""
+    if 'errors' in data:
+        return data['errors'].astype(object)
+    # Chunks written before errors were recorded: failures are the all-NaN rows
+    failed = np.isnan(data['results']).all(axis=1)
+    return np.where(failed, 'unknown error', '').astype(object)
+
+
+def _evaluate_chunk(out_dir, chunk_id, samples):
+    """
+    Optimize every sample in a chunk and write it to disk
+
+    Failed samples get NaN results and their error message in `errors`
+    ('' for samples that succeeded). Returns (chunk_id, number failed).
+    """
+    solver = run_optimization
+    if solver is None:
+        from optimizer import run_optimization as solver
+
+    results = np.full((len(samples), len(RESULT_COLUMNS)), np.nan)
+    errors = [''] * len(samples)
+    for i, row in enumerate(samples):
+        try:
+            result = solver(dict(zip(INPUT_COLUMNS, row.tolist())))
+            results[i] = [result[col] for col in RESULT_COLUMNS]
+        except Exception as e:
+            errors[i] = f"{type(e).__name__}: {e}"
+
+    # Write to a temporary name first so an interrupted run never leaves a half-written chunk
+    path = _chunk_path(out_dir, chunk_id)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, inputs=samples, results=results, errors=np.array(errors, dtype=str))
+    os.replace(tmp_path, path)
+    return chunk_id, sum(1 for error in errors if error)
+
+
+def run_sweep(out_dir, samples, workers=None, chunk_size=10000, config=None, progress=None):
+    """
+    Evaluate `samples` (an (N, 5) array in INPUT_COLUMNS order) into `out_dir`
+
+    Samples are split into chunks of `chunk_size` and farmed out to a process
+    pool; each finished chunk is written as its own .npz file. Re-running with
+    the same samples skips chunks that are already on disk, so an interrupted
+    sweep resumes where it stopped. `config` and a hash of `samples` are stored
+    in the manifest and must match on resume. `progress(done, total)` is called after every chunk.
+
+    Returns {'chunks', 'samples', 'failed'}, where `failed` counts samples
+    whose optimization raised, including those in chunks from earlier runs.
+    """
+    samples = np.asarray(samples, dtype=float)
+    n_chunks = -(-len(samples) // chunk_size)
+
+    # Round-trip through JSON so the manifest compares equal to the stored copy
+    manifest = json.loads(json.dumps({
+        'columns': INPUT_COLUMNS,
+        'results': RESULT_COLUMNS,
+        'n_samples': len(samples),
+        'samples_sha256': hashlib.sha256(np.ascontiguousarray(samples).tobytes()).hexdigest(),
+        'chunk_size': chunk_size,
+        'config': config or {},
+    }))
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if json.load(f) != manifest:
+                raise ValueError(f"{out_dir} holds a different sweep; use a new output directory")
+    else:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    todo = []
+    failed = 0
+    for c in range(n_chunks):
+        if os.path.exists(_chunk_path(out_dir, c)):
+            with np.load(_chunk_path(out_dir, c)) as data:
+                failed += int(np.count_nonzero(_chunk_errors(data)))
+        else:
+            todo.append(c)
+    done = n_chunks - len(todo)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_evaluate_chunk, out_dir, c, samples[c * chunk_size:(c + 1) * chunk_size])
+            for c in todo
+        ]
+        for future in as_completed(futures):
+            failed += future.result()[1]
+            done += 1
+            if progress:
+                progress(done, n_chunks)
+
+    return {'chunks': n_chunks, 'samples': len(samples), 'failed': failed}
+
+
+def load_sweep(out_dir):
+    """
+    Load every finished chunk of a sweep into one DataFrame of inputs and results
+
+    The `error` column holds each failed sample's message ('' on success);
+    frame.attrs['failed'] is the number of failed samples.
+    """
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    n_chunks = -(-manifest['n_samples'] // manifest['chunk_size'])
+    frames = []
+    errors = []
+    for chunk_id in range(n_chunks):
+        path = _chunk_path(out_dir, chunk_id)
+        if os.path.exists(path):
+            with np.load(path) as data:
+                frames.append(np.hstack([data['inputs'], data['results']]))
+                errors.append(_chunk_errors(data))
+
+    columns = manifest['columns'] + manifest['results']
+    if not frames:
+        frame = pd.DataFrame(columns=columns, dtype=float)
+        frame['error'] = pd.Series(dtype=object)
+    else:
+        frame = pd.DataFrame(np.vstack(frames), columns=columns)
+        frame['error'] = np.concatenate(errors)
+    frame.attrs['failed'] = int((frame['error'] != '').sum())
+    return frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep run_optimization over a design space")
+    parser.add_argument('out_dir', help="Output directory (re-run the same command to resume)")
+    parser.add_argument('--method', choices=['grid', 'lhs'], default='lhs')
+    parser.add_argument('--points', type=int, default=10, help="Grid points per input (grid method)")
+    parser.add_argument('--samples', type=int, default=10000, help="Number of samples (lhs method)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (lhs method)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    for name in INPUT_COLUMNS:
+        parser.add_argument(f"--{name}", type=float, nargs=2, metavar=('MIN', 'MAX'),
+                            default=DEFAULT_RANGES[name])
+    args = parser.parse_args(argv)
+
+    ranges = {name: tuple(getattr(args, name)) for name in INPUT_COLUMNS}
+    if args.method == 'grid':
+        samples = grid_samples(ranges, args.points)
+        config = {'method': 'grid', 'points': args.points, 'ranges': ranges}
+    else:
+        samples = latin_hypercube_samples(ranges, args.samples, args.seed)
+        config = {'method': 'lhs', 'samples': args.samples, 'seed': args.seed, 'ranges': ranges}
+
+    def report(done, total):
+        print(f"\r{done}/{total} chunks", end='', flush=True)
+
+    summary = run_sweep(args.out_dir, samples, workers=args.workers, chunk_size=args.chunk_size,
+                        config=config, progress=report)
+    print()
+    if summary['failed']:
+        print(f"{summary['failed']} of {summary['samples']} samples failed; see the error column of load_sweep()")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""
+Monte Carlo uncertainty propagation for the Propeller Optimizer
+Draws vessel inputs from distributions in seeded, vectorized blocks and
+reports percentiles of hull resistance, thrust margin and attainable speed
+for a fixed design, optionally re-optimizing every sample for eta/KT/KQ
+
+Example:
+    python src/uncertainty.py -n 100000 --vary displacement_t normal 9.72 0.5 \\
+        --vary power_kw uniform 950 1045 --workers 8
+"""
+
+import argparse
+import collections
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from batch import INPUT_COLUMNS
+from savitsky import predict_speed, propeller_thrust_kn, resistance
+
+# name -> (number of parameters, sampler(rng, params, n))
+DISTRIBUTIONS = {
+    'normal': (2, lambda rng, p, n: rng.normal(p[0], p[1], n)),
+    'uniform': (2, lambda rng, p, n: rng.uniform(p[0], p[1], n)),
+    'triangular': (3, lambda rng, p, n: rng.triangular(p[0], p[1], p[2], n)),
+    'lognormal': (2, lambda rng, p, n: rng.lognormal(p[0], p[1], n)),
+}
+
+DESIGN_COLUMNS = ['D', 'P_D', 'KT', 'KQ', 'eta']
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+
+def validate_distributions(distributions):
+    """Check {input: (kind, *params)} against INPUT_COLUMNS and DISTRIBUTIONS"""
+    for name, (kind, *params) in distributions.items():
+        if name not in INPUT_COLUMNS:
+            raise ValueError(f"Unknown input {name!r}; expected one of {', '.join(INPUT_COLUMNS)}")
+        if kind not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {kind!r}; expected one of {', '.join(DISTRIBUTIONS)}")
+        if len(params) != DISTRIBUTIONS[kind][0]:
+            raise ValueError(f"{kind} distribution for {name} takes {DISTRIBUTIONS[kind][0]} parameters")
+
+
+def draw_samples(spec, distributions, n, rng):
+    """
+    Draw n samples of every input as arrays
+
+    Inputs named in `distributions` are sampled; the rest stay at their
+    value in `spec`.
+    """
+    samples = {}
+    for name in INPUT_COLUMNS:
+        if name in distributions:
+            kind, *params = distributions[name]
+            samples[name] = DISTRIBUTIONS[kind][1](rng, params, n)
+        else:
+            samples[name] = np.full(n, float(spec[name]))
+    return samples
+
+
+def _evaluate_block(spec, distributions, design, hull, n, seed, reoptimize):
+    """
+    Worker entry point: sample one block and evaluate the fixed design on it
+
+    Returns (samples, outputs, errors); `errors` holds the message of each
+    failed re-optimization ('' where it succeeded, empty without reoptimize).
+    """
+    samples = draw_samples(spec, distributions, n, np.random.default_rng(seed))
+    beam_m, loa_m, propulsive_efficiency = hull['beam_m'], hull['loa_m'], hull['propulsive_efficiency']
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        hull_curve = resistance(samples['V_knots'], samples['displacement_t'], beam_m, loa_m=loa_m)
+        thrust_kn = propeller_thrust_kn(design['KT'], samples['rpm'], design['D'])
+        outputs = {
+            'resistance_kn': hull_curve['resistance_kn'],
+            'trim_deg': hull_curve['trim_deg'],
+            'savitsky_valid': hull_curve['valid'],
+            'thrust_kn': thrust_kn,
+            'thrust_margin': thrust_kn / hull_curve['resistance_kn'] - 1,
+            'attainable_speed_knots': predict_speed(samples['power_kw'], samples['displacement_t'], beam_m,
+                                                    loa_m=loa_m, propulsive_efficiency=propulsive_efficiency),
+        }
+
+    if reoptimize:
+        from optimizer import run_optimization
+
+        optimized = np.full((n, len(DESIGN_COLUMNS)), np.nan)
+        errors = [''] * n
+        for i in range(n):
+            try:
+                result = run_optimization({name: float(samples[name][i]) for name in INPUT_COLUMNS})
+                optimized[i] = [result[name] for name in DESIGN_COLUMNS]
+            except Exception as e:
+                errors[i] = f"{type(e).__name__}: {e}"
+        outputs.update({f"optimized_{name}": optimized[:, j] for j, name in enumerate(DESIGN_COLUMNS)})
+    else:
+        errors = []
+
+    return samples, outputs, errors
+
+
+def summarize(outputs, percentiles=DEFAULT_PERCENTILES):
+    """
+    Mean, standard deviation and percentiles of each output array, ignoring NaN
+
+    Boolean outputs (the Savitsky validity mask) are reported as the fraction
+    of samples where they hold.
+    """
+    summary = {}
+    for name, values in outputs.items():
+        if values.dtype == bool:
+            summary[name] = {'n': int(values.size), 'fraction': float(values.mean())}
+            continue
+        finite = values[np.isfinite(values)]
+        entry = {'n': int(finite.size), 'failed': int(values.size - finite.size)}
+        if finite.size:
+            entry.update(mean=float(finite.mean()), std=float(finite.std()))
+            entry.update({f"p{p:g}": float(v) for p, v in zip(percentiles, np.percentile(finite, percentiles))})
+        summary[name] = entry
+
+    if 'thrust_margin' in outputs:
+        margin = outputs['thrust_margin']
+        summary['thrust_margin']['probability_negative'] = float(np.mean(margin[np.isfinite(margin)] < 0))
+    return summary
+
+
+def run_uncertainty(spec, distributions, n=10000, seed=0, design=None, beam_m=2.96, loa_m=13.5,
+                    propulsive_efficiency=0.55, block_size=5000, workers=None, reoptimize=False,
+                    percentiles=DEFAULT_PERCENTILES):
+    """
+    Propagate input uncertainty through a fixed propeller design
+
+    `distributions` maps input names to (kind, *params), e.g.
+    {'displacement_t': ('normal', 9.72, 0.5)}. The design (a run_optimization
+    result) defaults to the optimum for `spec`. Samples are drawn in blocks of
+    `block_size`, each with its own child of SeedSequence(seed), so results
+    are identical for any worker count. Thrust uses the design's KT at the
+    sampled rpm. reoptimize=True also runs run_optimization on every sample,
+    which costs one full optimization per sample; samples where it fails get
+    NaN optimized values, their messages in `errors` and a count in
+    summary['reoptimize'].
+
+    The summary's `savitsky_valid` fraction is the share of samples inside
+    the range of Savitsky's data; resistance outside it is extrapolated.
+
+    Returns {'design', 'summary', 'samples', 'outputs', 'errors'}.
+    """
+    if n < 1:
+        raise ValueError(f"Need at least one sample, got n={n}")
+    validate_distributions(distributions)
+    if design is None:
+        from optimizer import run_optimization
+        design = run_optimization({name: float(spec[name]) for name in INPUT_COLUMNS})
+
+    design = {name: float(design[name]) for name in DESIGN_COLUMNS}
+    hull = {'beam_m': beam_m, 'loa_m': loa_m, 'propulsive_efficiency': propulsive_efficiency}
+    sizes = [min(block_size, n - start) for start in range(0, n, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if workers == 1:
+        blocks = [_evaluate_block(spec, distributions, design, hull, size, block_seed, reoptimize)
+                  for size, block_seed in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_evaluate_block, spec, distributions, design, hull, size, block_seed, reoptimize)
+                       for size, block_seed in zip(sizes, seeds)]
+            blocks = [future.result() for future in futures]
+
+    samples = {name: np.concatenate([block[0][name] for block in blocks]) for name in INPUT_COLUMNS}
+    outputs = {name: np.concatenate([block[1][name] for block in blocks]) for name in blocks[0][1]}
+    errors = [error for block in blocks for error in block[2]]
+
+    summary = summarize(outputs, percentiles)
+    if reoptimize:
+        failures = collections.Counter(error for error in errors if error)
+        summary['reoptimize'] = {'n': n, 'failed': sum(failures.values()), 'errors': dict(failures)}
+    return {
+        'design': design,
+        'summary': summary,
+        'samples': samples,
+        'outputs': outputs,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo uncertainty analysis of a propeller design")
+    parser.add_argument('-n', '--samples', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--block-size', type=int, default=5000)
+    parser.add_argument('--vary', nargs='+', action='append', default=[], metavar='ARG',
+                        help="Input distribution, e.g. --vary displacement_t normal 9.72 0.5")
+    parser.add_argument('--beam', type=float, default=2.96, help="Beam (m)")
+    parser.add_argument('--loa', type=float, default=13.5, help="Length overall (m)")
+    parser.add_argument('--reoptimize', action='store_true', help="Also re-optimize every sample (slow)")
+    # Nominal vessel, defaulting to the patrol boat preset
+    defaults = {'V_knots': 58.0, 'displacement_t': 9.72, 'draft_m': 0.65, 'power_kw': 1045.0, 'rpm': 2233.0}
+    for name in INPUT_COLUMNS:
+        parser.add_argument(f'--{name}', type=float, default=defaults[name])
+    args = parser.parse_args()
+
+    distributions = {}
+    for name, *rest in args.vary:
+        if not rest:
+            parser.error(f"--vary {name}: give a distribution and its parameters, e.g. normal 9.72 0.5")
+        kind, *params = rest
+        try:
+            distributions[name] = (kind, *map(float, params))
+        except ValueError:
+            parser.error(f"--vary {name}: parameters must be numbers, got {' '.join(params)}")
+    try:
+        validate_distributions(distributions)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.samples < 1:
+        parser.error(f"--samples must be at least 1, got {args.samples}")
+
+    spec = {name: getattr(args, name) for name in INPUT_COLUMNS}
+    report = run_uncertainty(spec, distributions, n=args.samples, seed=args.seed, beam_m=args.beam,
+                             loa_m=args.loa, block_size=args.block_size, workers=args.workers,
+                             reoptimize=args.reoptimize)
+    print(json.dumps({'design': report['design'], 'summary': report['summary']}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+PROPELLER_DATABASE = """\
+vessel_type,speed_knots,displacement_tons,draft_m,beam_m,power_kw,rpm,diameter_m,pitch_ratio,kt,kq,efficiency,blade_count,material,notes
+patrol_boat,58,9.72,0.65,2.96,1045,2233,0.60,1.50,0.144,0.041,0.707,3,bronze,Surface piercing patrol configuration
+racing_yacht,45,5.5,0.50,2.50,650,2500,0.48,1.40,0.138,0.038,0.685,3,stainless,Racing configuration
+fishing_vessel,25,15.0,1.20,4.00,450,1800,0.85,1.05,0.210,0.032,0.620,4,bronze,Workboat configuration
+cruise_boat,35,12.0,0.85,3.20,800,2100,0.70,1.20,0.180,0.035,0.650,3,nibral,Cruise configuration
+"""
+
+SPEED_RANGES = """\
+speed_category,min_speed,max_speed,propeller_type,cavitation_risk,recommended_pitch_ratio,recommended_blade_count
+low_speed,0,15,Conventional,Low,0.9,4
+medium_low,15,25,Conventional,Low,1.0,4
+medium,25,35,Conventional,Medium,1.15,3
+medium_high,35,45,Surface piercing,Medium,1.3,3
+high_speed,45,60,Surface piercing,High,1.45,3
+very_high,60,80,Surface piercing,Very High,1.6,3
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A data/ directory with the sample propeller database and speed ranges"""
+    (tmp_path / 'propeller_database.csv').write_text(PROPELLER_DATABASE, encoding='utf-8')
+    (tmp_path / 'speed_ranges.csv').write_text(SPEED_RANGES, encoding='utf-8')
+    return tmp_path
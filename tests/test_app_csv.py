@@ -0,0 +1,32 @@
+import os
+
+import pytest
+import streamlit as st
+
+from conftest import PROPELLER_DATABASE, ROOT_DIR, SPEED_RANGES
+
+AppTest = pytest.importorskip('streamlit.testing.v1').AppTest
+
+
+@pytest.fixture
+def app_dir(tmp_path, monkeypatch):
+    """Run the app from a directory whose data/ holds only the first vessel"""
+    data = tmp_path / 'data'
+    data.mkdir()
+    header, first = PROPELLER_DATABASE.splitlines()[:2]
+    (data / 'propeller_database.csv').write_text(f"{header}\n{first}\n", encoding='utf-8')
+    (data / 'speed_ranges.csv').write_text(SPEED_RANGES, encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    st.cache_resource.clear()
+    yield tmp_path
+    st.cache_resource.clear()
+
+
+def test_single_vessel_database(app_dir):
+    app = AppTest.from_file(os.path.join(ROOT_DIR, 'app_csv.py'), default_timeout=60).run()
+    assert not app.exception
+    assert [slider.label for slider in app.sidebar.slider] == ["Speed (knots)"]
+
+    app.sidebar.button[0].click().run()
+    assert not app.exception
+    assert app.metric[0].value == 'Patrol Boat'
@@ -0,0 +1,59 @@
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch import INPUT_COLUMNS, RESULT_COLUMNS, run_optimization_batch, spec_matrix
+
+PATROL = {'V_knots': 58.0, 'displacement_t': 9.72, 'draft_m': 0.65, 'power_kw': 1045.0, 'rpm': 2233.0}
+CRUISE = {'V_knots': 35.0, 'displacement_t': 12.0, 'draft_m': 0.85, 'power_kw': 800.0, 'rpm': 2100.0}
+
+
+@pytest.fixture
+def solver_calls(monkeypatch):
+    """Stand-in optimizer whose design encodes the spec; returns the list of specs it was called with"""
+    calls = []
+
+    def run_optimization(params):
+        calls.append(params)
+        return {'D': params['draft_m'], 'P_D': params['V_knots'] / 40, 'KT': 0.1, 'KQ': 0.03,
+                'eta': params['rpm'] / 4000}
+
+    monkeypatch.setitem(sys.modules, 'optimizer', types.SimpleNamespace(run_optimization=run_optimization))
+    return calls
+
+
+def test_dataframe_keeps_index_and_deduplicates(solver_calls):
+    fleet = pd.DataFrame([PATROL, CRUISE, PATROL, PATROL], index=['a', 'b', 'c', 'd'])
+    designs = run_optimization_batch(fleet)
+
+    assert len(solver_calls) == 2
+    assert list(designs.index) == ['a', 'b', 'c', 'd']
+    assert list(designs.columns) == RESULT_COLUMNS
+    np.testing.assert_allclose(designs['D'], [0.65, 0.85, 0.65, 0.65])
+    np.testing.assert_allclose(designs['eta'], [2233 / 4000, 2100 / 4000, 2233 / 4000, 2233 / 4000])
+
+
+def test_structured_array(solver_calls):
+    dtype = [(name, 'f8') for name in INPUT_COLUMNS] + [('name', 'U16')]
+    fleet = np.array([tuple(CRUISE.values()) + ('cruise',), tuple(PATROL.values()) + ('patrol',)], dtype=dtype)
+    designs = run_optimization_batch(fleet)
+
+    assert list(designs.index) == [0, 1]
+    np.testing.assert_allclose(designs['D'], [0.85, 0.65])
+
+
+def test_empty_input(solver_calls):
+    designs = run_optimization_batch(pd.DataFrame(columns=INPUT_COLUMNS, dtype=float))
+    assert designs.empty
+    assert list(designs.columns) == RESULT_COLUMNS
+    assert solver_calls == []
+
+
+def test_spec_matrix_rejects_bad_input():
+    with pytest.raises(ValueError, match="rpm"):
+        spec_matrix(pd.DataFrame([{k: v for k, v in PATROL.items() if k != 'rpm'}]))
+    with pytest.raises(TypeError):
+        spec_matrix([PATROL])
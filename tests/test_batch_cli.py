@@ -0,0 +1,48 @@
+import csv
+import json
+import subprocess
+import sys
+
+from conftest import ROOT_DIR
+
+
+def run_csv_engine(data_dir, specs, output, *options):
+    subprocess.run(
+        [sys.executable, 'src/batch_cli.py', str(specs), '-o', str(output), '--engine', 'csv', '--workers', '1',
+         '--database', str(data_dir / 'propeller_database.csv'),
+         '--speed-ranges', str(data_dir / 'speed_ranges.csv'), *options],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+    )
+
+
+def test_csv_engine_runs_without_optimizer(data_dir, tmp_path):
+    specs = tmp_path / 'fleet.csv'
+    specs.write_text("V_knots,displacement_t,draft_m,power_kw,rpm\n"
+                     "58,9.72,0.65,1045,2233\n"
+                     "30,7,0.6,500,2000\n", encoding='utf-8')
+    output = tmp_path / 'designs.csv'
+    run_csv_engine(data_dir, specs, output)
+
+    with open(output, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['similar_vessel'] for row in rows] == ['patrol_boat', 'cruise_boat']
+    assert [row['source'] for row in rows] == ['CSV Database', 'CSV Database']
+    assert rows[0]['propeller_type'] == 'Surface piercing'
+
+
+def test_reports_handle_missing_notes(data_dir, tmp_path):
+    with open(data_dir / 'propeller_database.csv', 'a', encoding='utf-8') as f:
+        f.write("pilot_boat,30,8.0,0.9,3.1,600,1900,0.65,1.10,0.190,0.034,0.640,4,bronze,\n")
+    specs = tmp_path / 'fleet.csv'
+    specs.write_text("V_knots,displacement_t,draft_m,power_kw,rpm\n30,8,0.9,600,1900\n", encoding='utf-8')
+
+    run_csv_engine(data_dir, specs, tmp_path / 'designs.jsonl', '--report', 'jsonl')
+    record = json.loads((tmp_path / 'designs.jsonl').read_text(encoding='utf-8'))
+    assert record['similar_vessel'] == 'pilot_boat'
+    assert record['blade_count'] == 4
+    assert record['notes'] == ''
+
+    run_csv_engine(data_dir, specs, tmp_path / 'designs.txt', '--report', 'txt')
+    report = (tmp_path / 'designs.txt').read_text(encoding='utf-8')
+    assert 'Blade Count:        4' in report
+    assert 'nan' not in report
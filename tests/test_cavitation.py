@@ -0,0 +1,28 @@
+import numpy as np
+
+from cavitation import BLADE_COUNTS, candidates, recommend, screen, shaft_immersion
+
+
+def test_lightly_loaded_two_blades_pass():
+    screening = screen(5.0, 1.0, 600, 12, 1.0, immersion_m=2.0)
+    assert recommend(screening) == (2, 0.3)
+    assert screening['feasible'][0].all()
+    assert (2, 0.3) in candidates(screening)
+
+
+def test_heavily_loaded_has_no_candidate():
+    screening = screen(200.0, 0.6, 2233, 30, 1.0, immersion_m=0.3)
+    assert recommend(screening) is None
+    assert candidates(screening) == []
+    assert np.isnan(screening['min_feasible_ear']).all()
+
+
+def test_keller_minimum_grows_with_blade_count():
+    screening = screen(20.0, 0.8, 1500, 30, 1.2, immersion_m=1.0)
+    assert len(screening['keller_min_ear']) == len(BLADE_COUNTS)
+    assert (np.diff(screening['keller_min_ear']) > 0).all()
+
+
+def test_shaft_immersion():
+    assert np.isclose(shaft_immersion(0.65, 0.6), 0.35)
+    assert shaft_immersion(0.2, 0.6) == 0.0
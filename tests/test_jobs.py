@@ -0,0 +1,48 @@
+import os
+import signal
+
+from jobs import JobQueue
+from result_cache import ResultCache
+
+
+def blade_counts(n):
+    # A set cannot be stored as JSON, so caching the result fails
+    return {n, n + 1}
+
+
+def test_uncacheable_result_still_completes(tmp_path):
+    queue = JobQueue(blade_counts, max_workers=1, cache=ResultCache(str(tmp_path / 'results.sqlite')))
+    try:
+        job_id = queue.submit(3)
+        assert queue.result(job_id, timeout=30) == {3, 4}
+        assert queue.status(job_id)['state'] == 'done'
+        # The finished key is released, so a repeat request gets a new job
+        assert queue.submit(3) != job_id
+    finally:
+        queue.shutdown()
+
+
+def test_dead_worker_does_not_wedge_the_queue():
+    queue = JobQueue(blade_counts, max_workers=1)
+    try:
+        assert queue.result(queue.submit(1), timeout=30) == {1, 2}
+        for pid in list(queue._pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        # Whether or not the pool has noticed the dead worker yet, the job finishes
+        first = queue.submit(2)
+        assert queue.wait(first, timeout=30)
+        # and identical requests after it run on a fresh pool
+        second = queue.submit(2)
+        assert queue.result(second, timeout=30) == {2, 3}
+    finally:
+        queue.shutdown()
+
+
+def test_submit_after_shutdown_fails_the_job():
+    queue = JobQueue(blade_counts, max_workers=1)
+    queue.shutdown()
+    job_id = queue.submit(5)
+    assert queue.wait(job_id, timeout=1)
+    assert queue.status(job_id)['state'] == 'failed'
+    assert queue.submit(5) != job_id
@@ -0,0 +1,39 @@
+import os
+
+import pandas as pd
+
+from propeller_store import binary_is_current, convert_to_binary, load_propeller_table
+
+# A vessel with no notes, to round-trip a missing string value
+EXTRA_ROW = "pilot_boat,30,8.0,0.9,3.1,600,1900,0.65,1.10,0.190,0.034,0.640,4,bronze,\n"
+
+
+def test_binary_matches_csv(data_dir):
+    csv_path = data_dir / 'propeller_database.csv'
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write(EXTRA_ROW)
+
+    from_csv = load_propeller_table(csv_path, prefer_binary=False)
+    convert_to_binary(csv_path)
+    from_binary = load_propeller_table(csv_path)
+
+    pd.testing.assert_frame_equal(from_binary, from_csv)
+    assert isinstance(from_binary['material'].dtype, pd.CategoricalDtype)
+    assert not isinstance(from_binary['notes'].dtype, pd.CategoricalDtype)
+    assert pd.isna(from_binary['notes'].iloc[-1])
+
+
+def test_stale_binary_falls_back_to_csv(data_dir):
+    csv_path = data_dir / 'propeller_database.csv'
+    binary_path = convert_to_binary(csv_path)
+    assert binary_is_current(binary_path, csv_path)
+
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write(EXTRA_ROW)
+    # Keep the mtime so only the size gives the edit away
+    stat = os.stat(binary_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert not binary_is_current(binary_path, csv_path)
+    table = load_propeller_table(csv_path)
+    assert list(table['vessel_type'])[-1] == 'pilot_boat'
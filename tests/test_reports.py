@@ -0,0 +1,12 @@
+import json
+
+import numpy as np
+
+from reports import iter_jsonl
+
+
+def test_jsonl_is_valid_json():
+    spec = {'V_knots': 58.0, 'rpm': np.int64(2233)}
+    row = {'blade_count': np.int64(3), 'efficiency': float('nan'), 'kt': np.float64(0.144)}
+    line = next(iter_jsonl([(spec, row)]))
+    assert json.loads(line) == {'V_knots': 58.0, 'rpm': 2233, 'blade_count': 3, 'efficiency': None, 'kt': 0.144}
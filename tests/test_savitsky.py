@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from savitsky import predict_speed, resistance
+
+# Patrol boat: 9.72 t, 2.96 m beam, 13.5 m LOA
+PATROL = {'displacement_t': 9.72, 'beam_m': 2.96, 'loa_m': 13.5}
+
+
+def test_patrol_boat_regression():
+    point = resistance(58, **PATROL)
+    assert point['resistance_kn'] == pytest.approx(24.19, abs=0.01)
+    assert point['trim_deg'] == pytest.approx(1.84, abs=0.01)
+    # Below Savitsky's 2 degree trim limit
+    assert not point['valid']
+
+    assert predict_speed(1045, **PATROL) == pytest.approx(52.69, abs=0.01)
+
+
+def test_broadcast_matches_scalar_calls():
+    speeds = np.linspace(25, 60, 8)
+    displacements = np.array([5.5, 9.72, 15.0])
+    beams = np.array([2.5, 2.96, 4.0])
+    loas = np.array([11.0, 13.5, 16.0])
+
+    grid = resistance(speeds[None, :], displacements[:, None], beams[:, None], loa_m=loas[:, None])
+    assert grid['resistance_kn'].shape == (3, 8)
+    for i in range(3):
+        hull = resistance(speeds, displacements[i], beams[i], loa_m=loas[i])
+        for name in ('resistance_kn', 'trim_deg', 'wetted_length_m', 'valid'):
+            np.testing.assert_allclose(grid[name][i], hull[name])
+
+    speeds_per_hull = predict_speed(1045, displacements, beams, loa_m=loas)
+    np.testing.assert_allclose(speeds_per_hull, [predict_speed(1045, d, b, loa_m=l)
+                                                 for d, b, l in zip(displacements, beams, loas)])
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+
+from service import OptimizerService
+
+try:
+    import optimizer
+except ImportError:
+    optimizer = None
+
+
+async def _request(app, method, path, payload=None):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app({'type': 'http', 'method': method, 'path': path}, receive, send)
+    return sent[0]['status'], json.loads(sent[1]['body'])
+
+
+def request(app, method, path, payload=None):
+    return asyncio.run(_request(app, method, path, payload))
+
+
+@pytest.fixture
+def service(data_dir):
+    app = OptimizerService(workers=1, database_path=str(data_dir / 'propeller_database.csv'))
+    yield app
+    app.stop()
+
+
+def test_match_and_predict_speed_without_optimizer(service):
+    status, matches = request(service, 'POST', '/match', {'speed': 45, 'displacement': 5.5, 'draft': 0.5, 'k': 2})
+    assert status == 200
+    assert matches[0]['vessel_type'] == 'racing_yacht'
+    assert matches[0]['distance'] == 0.0
+    assert len(matches) == 2
+
+    status, result = request(service, 'POST', '/predict-speed',
+                             {'power_kw': 1045, 'displacement_t': 9.72, 'beam_m': 2.96, 'loa_m': 13.5})
+    assert status == 200
+    assert 40 < result['V_knots'] < 70
+
+
+SPEC = {'V_knots': 58, 'displacement_t': 9.72, 'draft_m': 0.65, 'power_kw': 1045, 'rpm': 2233}
+
+
+@pytest.mark.parametrize('endpoint, function', [('/optimize', 'run_optimization'),
+                                                ('/size-diameter', 'size_diameter')])
+def test_optimizer_endpoints(service, endpoint, function):
+    status, result = request(service, 'POST', endpoint, SPEC)
+    if hasattr(optimizer, function):
+        assert status == 200
+        assert 'error' not in result
+    else:
+        assert status == 422
+        assert result['error'] == "RuntimeError: The optimizer is not available on this server"
+
+
+def test_failed_item_is_422_with_json_error(service):
+    status, result = request(service, 'POST', '/predict-speed', {'power_kw': 1045})
+    assert status == 422
+    assert 'KeyError' in result['error']
+
+
+def test_broken_pool_returns_503_and_recovers(service):
+    service.start()
+    for pid in list(service.pool._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    status, result = request(service, 'POST', '/match', {'speed': 45, 'displacement': 5.5, 'draft': 0.5})
+    assert status == 503
+    assert 'error' in result
+
+    status, _ = request(service, 'POST', '/match', {'speed': 45, 'displacement': 5.5, 'draft': 0.5})
+    assert status == 200
@@ -0,0 +1,29 @@
+import pytest
+
+from speed_ranges import SpeedRangeIndex
+
+
+def speed_range(category, low, high):
+    return {'speed_category': category, 'min_speed': str(low), 'max_speed': str(high)}
+
+
+def test_shared_endpoint_belongs_to_lower_range(data_dir):
+    index = SpeedRangeIndex.from_csv(data_dir / 'speed_ranges.csv')
+    assert index.gaps == []
+    assert index.lookup(25)['speed_category'] == 'medium_low'
+    assert index.lookup(25.5)['speed_category'] == 'medium'
+    assert index.lookup(90) is None
+    assert list(index.positions([25, 25.5, 90])) == [1, 2, -1]
+
+
+def test_overlap_raises():
+    with pytest.raises(ValueError, match="overlap"):
+        SpeedRangeIndex([speed_range('low', 0, 20), speed_range('medium', 15, 35)])
+
+
+def test_gaps_are_reported():
+    with pytest.warns(UserWarning, match="20-25"):
+        index = SpeedRangeIndex([speed_range('medium', 25, 35), speed_range('low', 0, 20)])
+    assert index.gaps == [(20.0, 25.0)]
+    assert index.lookup(22) is None
+    assert index.lookup(30)['speed_category'] == 'medium'
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import sweep
+
+
+def fails_above_60_knots(params):
+    if params['V_knots'] > 60:
+        raise ValueError("no feasible design")
+    return {'D': 0.6, 'P_D': 1.5, 'KT': 0.144, 'KQ': 0.041, 'eta': 0.707, 'J': 1.0}
+
+
+def test_failures_are_recorded(tmp_path, monkeypatch):
+    # Workers are forked, so they see the patched solver
+    monkeypatch.setattr(sweep, 'run_optimization', fails_above_60_knots)
+    samples = sweep.grid_samples(dict(sweep.DEFAULT_RANGES, V_knots=(40.0, 70.0)), 2)
+
+    summary = sweep.run_sweep(str(tmp_path), samples, workers=1, chunk_size=10)
+    assert summary == {'chunks': 4, 'samples': 32, 'failed': 16}
+    # Resuming counts the failures already on disk
+    assert sweep.run_sweep(str(tmp_path), samples, workers=1, chunk_size=10)['failed'] == 16
+
+    frame = sweep.load_sweep(str(tmp_path))
+    assert frame.attrs['failed'] == 16
+    failed = frame['V_knots'] > 60
+    assert (frame.loc[failed, 'error'] == "ValueError: no feasible design").all()
+    assert (frame.loc[~failed, 'error'] == '').all()
+    assert np.isnan(frame.loc[failed, sweep.RESULT_COLUMNS].to_numpy()).all()
+
+
+def test_different_samples_do_not_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(sweep, 'run_optimization', fails_above_60_knots)
+    samples = sweep.latin_hypercube_samples(sweep.DEFAULT_RANGES, 8, seed=0)
+    sweep.run_sweep(str(tmp_path), samples, workers=1, chunk_size=4)
+
+    other = sweep.latin_hypercube_samples(sweep.DEFAULT_RANGES, 8, seed=1)
+    with pytest.raises(ValueError, match="different sweep"):
+        sweep.run_sweep(str(tmp_path), other, workers=1, chunk_size=4)
@@ -0,0 +1,46 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from uncertainty import run_uncertainty
+
+SPEC = {'V_knots': 58.0, 'displacement_t': 9.72, 'draft_m': 0.65, 'power_kw': 1045.0, 'rpm': 2233.0}
+DESIGN = {'D': 0.6, 'P_D': 1.5, 'KT': 0.144, 'KQ': 0.041, 'eta': 0.707}
+DISTRIBUTIONS = {'displacement_t': ('normal', 9.72, 0.5), 'power_kw': ('uniform', 950.0, 1045.0)}
+
+
+def test_fixed_design_is_reproducible_across_workers():
+    serial = run_uncertainty(SPEC, DISTRIBUTIONS, n=300, design=DESIGN, block_size=100, workers=1)
+    pooled = run_uncertainty(SPEC, DISTRIBUTIONS, n=300, design=DESIGN, block_size=100, workers=2)
+    np.testing.assert_array_equal(serial['outputs']['thrust_margin'], pooled['outputs']['thrust_margin'])
+    assert serial['summary']['resistance_kn']['n'] == 300
+
+
+def test_summary_reports_savitsky_validity():
+    # The patrol boat trims at about 1.8 degrees, below Savitsky's 2 degree limit
+    report = run_uncertainty(SPEC, {}, n=10, design=DESIGN, workers=1)
+    assert report['summary']['savitsky_valid']['fraction'] == 0.0
+
+
+def test_rejects_empty_runs():
+    with pytest.raises(ValueError):
+        run_uncertainty(SPEC, DISTRIBUTIONS, n=0, design=DESIGN, workers=1)
+
+
+def test_reoptimize_failures_are_reported(monkeypatch):
+    def run_optimization(params):
+        if params['displacement_t'] > 9.72:
+            raise ValueError("no feasible design")
+        return DESIGN
+
+    monkeypatch.setitem(sys.modules, 'optimizer', types.SimpleNamespace(run_optimization=run_optimization))
+    report = run_uncertainty(SPEC, DISTRIBUTIONS, n=200, design=DESIGN, workers=1, reoptimize=True)
+
+    heavy = report['samples']['displacement_t'] > 9.72
+    assert report['summary']['reoptimize'] == {
+        'n': 200, 'failed': int(heavy.sum()), 'errors': {"ValueError: no feasible design": int(heavy.sum())},
+    }
+    assert np.isnan(report['outputs']['optimized_eta'][heavy]).all()
+    assert [bool(error) for error in report['errors']] == heavy.tolist()
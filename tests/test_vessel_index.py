@@ -0,0 +1,57 @@
+import numpy as np
+
+from propeller_store import load_propeller_table
+from vessel_index import VesselIndex, idw_weights, interpolate
+
+
+def linear_scan(table, speed, displacement, draft):
+    """The row-by-row search app_csv used before the KD-tree"""
+    best, min_diff = None, float('inf')
+    for position, vessel in enumerate(table.itertuples()):
+        difference = (abs(vessel.speed_knots - speed) * 2.0 + abs(vessel.displacement_tons - displacement) * 1.0
+                      + abs(vessel.draft_m - draft) * 3.0)
+        if difference < min_diff:
+            best, min_diff = position, difference
+    return best, min_diff
+
+
+def test_nearest_matches_linear_scan(data_dir):
+    table = load_propeller_table(data_dir / 'propeller_database.csv')
+    index = VesselIndex.from_table(table)
+    rng = np.random.default_rng(0)
+    queries = np.column_stack([rng.uniform(10, 80, 200), rng.uniform(1, 50, 200), rng.uniform(0.3, 3, 200)])
+
+    distances, positions = index.nearest_many(*queries.T)
+    for query, distance, position in zip(queries, distances[:, 0], positions[:, 0]):
+        best, min_diff = linear_scan(table, *query)
+        assert position == best
+        assert np.isclose(distance, min_diff)
+
+
+def test_exact_match_takes_all_the_weight():
+    weights = idw_weights([[0.0, 2.0, 4.0], [1.0, 2.0, np.inf]])
+    np.testing.assert_allclose(weights[0], [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(weights[1], [0.8, 0.2, 0.0])
+
+
+def test_interpolate_clamps_missing_neighbours():
+    # cKDTree pads with distance inf and position n when k exceeds the row count
+    values = np.array([[1.0, 10.0], [3.0, 30.0]])
+    blended = interpolate(values, [[1.0, 1.0, np.inf]], [[0, 1, 2]])
+    np.testing.assert_allclose(blended, [[2.0, 20.0]])
+
+
+def test_nearest_many_matches_nearest(data_dir):
+    index = VesselIndex.from_table(load_propeller_table(data_dir / 'propeller_database.csv'))
+    queries = [(45, 5.5, 0.5), (30, 12, 1.0), (70, 40, 2.5)]
+
+    distances, positions = index.nearest_many(*np.array(queries).T, k=3)
+    for query, row_distances, row_positions in zip(queries, distances, positions):
+        single_distances, single_positions = index.nearest(*query, k=3)
+        np.testing.assert_allclose(row_distances, single_distances)
+        np.testing.assert_array_equal(row_positions, single_positions)
+    assert distances[0, 0] == 0.0
+
+    # k beyond the database size is capped, not padded
+    distances, positions = index.nearest(45, 5.5, 0.5, k=10)
+    assert len(distances) == len(positions) == len(index)